@@ -0,0 +1,197 @@
+import os
+import re
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from data_store import (DATA_PATH, EPICS_TABLE, MAINTENANCE_TABLE, UTILIZATION_TABLE, read_table,
+                        partition_weeks)
+from excel_export import write_sheets
+from report_engine import REPORT_COLUMNS, REPORT_FILE_STEMS, generate_all_reports, report_excel_sheets
+from template_engine import write_report
+
+# Report types selectable on the command line
+REPORT_TYPES = {
+    'standard': "Standard Report",
+    'rpa': "RPA LTR Report",
+    'kaluza': "Kaluza LTR Report"
+}
+
+# Weeks reported when none are given: the latest quarter
+DEFAULT_WEEK_COUNT = 13
+
+# Most worker processes used by default; each holds its own copy of the report data
+DEFAULT_MAX_WORKERS = 4
+
+# Report data shared by every job in a worker process, set once per worker by
+# init_worker so the frames are not pickled again for each job
+_shared_data = None
+
+def init_worker(data):
+    """
+    Keep the report data in the worker process
+
+    Args:
+        data (dict): 'epics', 'maintenance' and 'utilization' DataFrames
+    """
+    global _shared_data
+    _shared_data = data
+
+def load_report_data(weeks, data_path=DATA_PATH):
+    """
+    Load the columns the reports read, for the given weeks only
+
+    Args:
+        weeks (list): YearWeek keys to load
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        dict: 'epics', 'maintenance' and 'utilization' DataFrames
+    """
+    tables = {'epics': EPICS_TABLE, 'maintenance': MAINTENANCE_TABLE, 'utilization': UTILIZATION_TABLE}
+    data = {}
+    for key, table in tables.items():
+        columns = list(dict.fromkeys(REPORT_COLUMNS[key] + ['YearWeek', 'Assignee']))
+        if key == 'utilization':
+            columns.remove('Assignee')
+        # Epics are reported across the whole portfolio, not just the weeks
+        table_weeks = None if key == 'epics' else weeks
+        data[key] = read_table(table, columns=columns, data_path=data_path, weeks=table_weeks)
+    return data
+
+def latest_weeks(count=DEFAULT_WEEK_COUNT, data_path=DATA_PATH):
+    """
+    List the latest YearWeeks in the utilization table
+
+    Args:
+        count (int): Number of weeks
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        list: Sorted YearWeek keys
+    """
+    return (partition_weeks(UTILIZATION_TABLE, data_path) or [])[-count:]
+
+def owner_slug(owner):
+    """File name fragment for an owner"""
+    return re.sub(r'[^A-Za-z0-9]+', '-', owner).strip('-').lower()
+
+def slice_data(data, week, owner=None):
+    """
+    Select the rows of one report job
+
+    Args:
+        data (dict): Report data shared by the jobs
+        week (int): YearWeek of the maintenance and utilization rows
+        owner (str): Optional Assignee of the epics and maintenance rows
+
+    Returns:
+        dict: 'epics', 'maintenance' and 'utilization' DataFrames
+    """
+    epics_df = data['epics']
+    maintenance_df = data['maintenance'][data['maintenance']['YearWeek'] == week]
+    utilization_df = data['utilization'][data['utilization']['YearWeek'] == week]
+    if owner is not None:
+        epics_df = epics_df[epics_df['Assignee'] == owner]
+        maintenance_df = maintenance_df[maintenance_df['Assignee'] == owner]
+    return {'epics': epics_df, 'maintenance': maintenance_df, 'utilization': utilization_df}
+
+def run_job(week, owner, report_types, output_dir):
+    """
+    Build and write every report type for one week and owner
+
+    Runs in a worker process, reading the data set up by init_worker. The
+    shared report frames are computed once for all the report types.
+
+    Args:
+        week (int): YearWeek to report
+        owner (str): Assignee to report, or None for everyone
+        report_types (list): Keys of REPORT_BUILDERS
+        output_dir (str): Directory the files are written to
+
+    Returns:
+        tuple: (week, owner, list of written file names)
+    """
+    reports = generate_all_reports(slice_data(_shared_data, week, owner), report_types)
+    suffix = f"_{week}" + (f"_{owner_slug(owner)}" if owner is not None else "")
+
+    written = []
+    for report_type, report in reports.items():
+        file_stem = REPORT_FILE_STEMS[report_type] + suffix
+        write_report(report_type, report, os.path.join(output_dir, f"{file_stem}.html"))
+        write_sheets(report_excel_sheets(report_type, report), os.path.join(output_dir, f"{file_stem}.xlsx"))
+        written += [f"{file_stem}.html", f"{file_stem}.xlsx"]
+    return week, owner, written
+
+def run_batch(weeks, owners, report_types, output_dir="reports", workers=1, data_path=DATA_PATH):
+    """
+    Generate reports for every combination of week and owner
+
+    The report data is loaded once and handed to each worker process when it
+    starts; each job only slices it.
+
+    Args:
+        weeks (list): YearWeek keys to report
+        owners (list): Assignees to report; None reports everyone together
+        report_types (list): Keys of REPORT_BUILDERS
+        output_dir (str): Directory the files are written to
+        workers (int): Number of worker processes
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        int: Number of failed jobs
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    data = load_report_data(weeks, data_path)
+    print(f"Loaded report data in {time.perf_counter() - start:.2f}s")
+
+    jobs = [(week, owner, report_types, output_dir) for week in weeks for owner in (owners or [None])]
+    failures = 0
+    if workers <= 1 or len(jobs) <= 1:
+        init_worker(data)
+        results = []
+        for job in jobs:
+            try:
+                results.append(run_job(*job))
+            except Exception as e:
+                failures += 1
+                print(f"Error generating reports for week {job[0]}, owner {job[1]}: {str(e)}")
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=init_worker,
+                                 initargs=(data,)) as executor:
+            futures = {executor.submit(run_job, *job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    failures += 1
+                    week, owner = futures[future][:2]
+                    print(f"Error generating reports for week {week}, owner {owner}: {str(e)}")
+
+    for week, owner, written in results:
+        print(f"Week {week}" + (f", {owner}" if owner is not None else "") + f": {len(written)} files")
+    print(f"Generated {len(results)} of {len(jobs)} report sets in {time.perf_counter() - start:.2f}s")
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate LTR reports for many weeks and owners without the dashboard")
+    parser.add_argument("--weeks", type=int, nargs="+",
+                        help=f"YearWeeks to report, e.g. 202516 (default: latest {DEFAULT_WEEK_COUNT} weeks)")
+    parser.add_argument("--owners", nargs="+",
+                        help="Assignees to report separately (default: one report set for everyone)")
+    parser.add_argument("--types", nargs="+", choices=list(REPORT_TYPES), default=list(REPORT_TYPES),
+                        help="Report types to generate (default: all)")
+    parser.add_argument("--output-dir", default="reports",
+                        help="Directory the reports are written to (default: reports)")
+    parser.add_argument("--workers", type=int, default=min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1),
+                        help=f"Number of worker processes (default: CPU count, at most {DEFAULT_MAX_WORKERS})")
+    args = parser.parse_args()
+
+    weeks = args.weeks or latest_weeks()
+    if not weeks:
+        print("No weeks to report. Run data_processor.py first.")
+    else:
+        report_types = [REPORT_TYPES[t] for t in args.types]
+        failures = run_batch(weeks, args.owners, report_types, args.output_dir, args.workers)
+        raise SystemExit(1 if failures else 0)
@@ -0,0 +1,121 @@
+import os
+import argparse
+import pandas as pd
+from data_processor import (SOURCES, COMBINE_ALL_GROUP_COLUMNS, COMBINE_ALL_SUM_COLUMNS, create_output_directory,
+                            clean_column_names, convert_date_columns, create_week_column, aggregate_combine_all,
+                            add_totals, totals_table)
+from data_store import WEEKLY_COMBINE_ALL_TABLE, write_table
+
+# Constants; data_processor.py builds the same weekly totals as part of its pipeline
+COMBINE_ALL_PATTERN = SOURCES['combine_all']['pattern']
+DEFAULT_CHUNKSIZE = SOURCES['combine_all']['chunksize']
+DATE_COLUMN = SOURCES['combine_all']['week_column']
+GROUP_COLUMNS = COMBINE_ALL_GROUP_COLUMNS
+SUM_COLUMNS = COMBINE_ALL_SUM_COLUMNS
+
+def find_combine_all_file(directory=None):
+    """
+    Find the latest Combine All export in a directory
+    
+    Args:
+        directory (str): Directory to search; defaults to the current directory
+    
+    Returns:
+        str: Path to the latest export, or None if there is none
+    """
+    directory = directory or os.getcwd()
+    files = sorted(file for file in os.listdir(directory)
+                   if file.endswith(".csv") and COMBINE_ALL_PATTERN in file)
+    return os.path.join(directory, files[-1]) if files else None
+
+def select_raw_columns(file_path):
+    """
+    Pick the raw export headers needed for the weekly aggregates
+    
+    Only these columns are parsed, so chunk memory does not grow with the
+    width of the export.
+    
+    Args:
+        file_path (str): Path to the Combine All export
+    
+    Returns:
+        list: Raw column names to read
+    """
+    header = pd.read_csv(file_path, nrows=0)
+    cleaned = clean_column_names(header).columns
+    needed = set(GROUP_COLUMNS + SUM_COLUMNS + [DATE_COLUMN])
+    return [raw for raw, clean in zip(header.columns, cleaned) if clean in needed]
+
+def aggregate_chunk(chunk):
+    """
+    Clean one chunk of the export and aggregate it per week, bot and project
+    
+    Args:
+        chunk (pandas.DataFrame): Raw chunk as read from CSV
+    
+    Returns:
+        pandas.DataFrame: Partial sums indexed by GROUP_COLUMNS, plus a Runs count
+    """
+    chunk = clean_column_names(chunk, inplace=True)
+    chunk = convert_date_columns(chunk, [DATE_COLUMN], source='combine_all', inplace=True)
+    chunk = create_week_column(chunk, DATE_COLUMN, inplace=True)
+    return aggregate_combine_all(chunk)
+
+def stream_combine_all(file_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream the Combine All export in fixed-size chunks into weekly running totals
+    
+    Each chunk is aggregated on its own and folded into the running totals,
+    so peak memory is bounded by the chunk size and the number of
+    (week, bot, project) groups rather than the size of the file.
+    
+    Args:
+        file_path (str): Path to the Combine All export
+        chunksize (int): Number of rows per chunk
+    
+    Returns:
+        pandas.DataFrame: Weekly totals per BOT_Name and project
+    """
+    totals = None
+    total_rows = 0
+    
+    reader = pd.read_csv(file_path, usecols=select_raw_columns(file_path), chunksize=chunksize)
+    for chunk_number, chunk in enumerate(reader, start=1):
+        totals = add_totals(totals, aggregate_chunk(chunk))
+        total_rows += len(chunk)
+        print(f"Folded chunk {chunk_number} ({total_rows} rows so far, {len(totals)} groups)")
+    
+    return totals_table(totals, GROUP_COLUMNS + SUM_COLUMNS + ['Runs'])
+
+def main(chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Main function to process the Combine All export
+    
+    Args:
+        chunksize (int): Number of rows per chunk
+    """
+    print("Starting Combine All processing...")
+    
+    output_path = create_output_directory("processed_data")
+    if not output_path:
+        return
+    
+    file_path = find_combine_all_file()
+    if not file_path:
+        print(f"File not found: Could not find a '{COMBINE_ALL_PATTERN}' export")
+        return
+    
+    print(f"Streaming file: {os.path.basename(file_path)}")
+    try:
+        weekly_df = stream_combine_all(file_path, chunksize=chunksize)
+        path = write_table(weekly_df, WEEKLY_COMBINE_ALL_TABLE, output_path)
+        print(f"\nExported weekly Combine All totals to: {path}")
+    except Exception as e:
+        print(f"Error processing Combine All export: {e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream the Combine All export into weekly totals")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Number of rows read per chunk")
+    args = parser.parse_args()
+    main(chunksize=args.chunksize)
@@ -0,0 +1,170 @@
+import pandas as pd
+from data_store import drop_unused_categories
+
+# Cube tables materialized by the processor. Each cube row holds additive
+# measures (sums and counts) for one combination of its keys, so any rollup
+# of the keys can be computed from the cube without the raw rows.
+UTILIZATION_CUBE_KEYS = ['YearWeek', 'Day', 'Flow Machine Group', 'Hour', 'desktop_taskstatus', 'ErrorCode']
+MAINTENANCE_CUBE_KEYS = ['YearWeek', 'Day', 'priority', 'Issue Type', 'Status']
+EPICS_CUBE_KEYS = ['YearWeek', 'Day', 'Status', 'priority', 'Assignee']
+
+def _group_cube(source, keys, measures):
+    """
+    Group a cube source frame by its keys and apply the measure aggregations
+
+    Args:
+        source (pandas.DataFrame): Key and measure columns
+        keys (list): Cube keys present in source
+        measures (dict): Named aggregations for DataFrame.agg
+
+    Returns:
+        pandas.DataFrame: One row per key combination
+    """
+    keys = [key for key in keys if key in source.columns]
+    return source.groupby(keys, dropna=False, observed=True).agg(**measures).reset_index()
+
+def build_utilization_cube(utilization_df):
+    """
+    Aggregate utilization rows by week, day, machine group, hour, status and error code
+
+    Args:
+        utilization_df (pandas.DataFrame): Processed utilization data
+
+    Returns:
+        pandas.DataFrame: Utilization cube
+    """
+    created = utilization_df['Created On']
+    source = pd.DataFrame({
+        'YearWeek': utilization_df['YearWeek'],
+        'Day': created.dt.normalize(),
+        'Hour': created.dt.hour,
+        'Utilization': utilization_df['Machine_Utilization__'],
+        'Idle': utilization_df['Idle_Percentage__'],
+        'Runtime': utilization_df['SumRuntime_duration__mins_']
+    })
+    for key in ['Flow Machine Group', 'desktop_taskstatus', 'ErrorCode']:
+        if key in utilization_df.columns:
+            source[key] = utilization_df[key]
+
+    return _group_cube(source, UTILIZATION_CUBE_KEYS, {
+        'Runs': ('Utilization', 'size'),
+        'Utilization_Sum': ('Utilization', 'sum'),
+        'Utilization_Count': ('Utilization', 'count'),
+        'Idle_Sum': ('Idle', 'sum'),
+        'Idle_Count': ('Idle', 'count'),
+        'Runtime_Sum': ('Runtime', 'sum')
+    })
+
+def build_maintenance_cube(maintenance_df):
+    """
+    Aggregate maintenance tickets by week, day, priority, issue type and status
+
+    Args:
+        maintenance_df (pandas.DataFrame): Processed maintenance data
+
+    Returns:
+        pandas.DataFrame: Maintenance cube
+    """
+    source = pd.DataFrame({
+        'YearWeek': maintenance_df['YearWeek'],
+        'Day': maintenance_df['created'].dt.normalize(),
+        'Hours': maintenance_df['SumMaintenance_Hours'],
+        'Allocation': maintenance_df['Maintenance_Time_Allocation_Percentage'],
+        'Weekly_Tickets': maintenance_df['Total_Maintenance_Tickets_By_Week']
+    })
+    for key in ['priority', 'Issue Type', 'Status']:
+        if key in maintenance_df.columns:
+            source[key] = maintenance_df[key]
+    source['Bugs_Completed'] = maintenance_df.get('Bug_Completed_Count_Last_Week', 0)
+
+    return _group_cube(source, MAINTENANCE_CUBE_KEYS, {
+        'Tickets': ('Hours', 'size'),
+        'Hours_Sum': ('Hours', 'sum'),
+        'Allocation_Sum': ('Allocation', 'sum'),
+        'Allocation_Count': ('Allocation', 'count'),
+        'Weekly_Tickets_Sum': ('Weekly_Tickets', 'sum'),
+        'Bugs_Completed_Sum': ('Bugs_Completed', 'sum')
+    })
+
+def build_epics_cube(epics_df):
+    """
+    Aggregate epics by week, creation day, status, priority and assignee
+
+    Args:
+        epics_df (pandas.DataFrame): Processed epics data
+
+    Returns:
+        pandas.DataFrame: Epics cube
+    """
+    source = epics_df[[key for key in EPICS_CUBE_KEYS if key in epics_df.columns]].copy()
+    source['Day'] = epics_df['created'].dt.normalize()
+    source['Impact'] = epics_df['Estimated Financial Impact']
+
+    return _group_cube(source, EPICS_CUBE_KEYS, {
+        'Epics': ('Impact', 'size'),
+        'Impact_Sum': ('Impact', 'sum')
+    })
+
+def rollup_utilization(cube, by=None):
+    """
+    Roll the utilization cube up to the given keys
+
+    Measures are returned under the raw column names the pages chart:
+    Machine_Utilization__ and Idle_Percentage__ are means,
+    SumRuntime_duration__mins_ is a sum and desktop_taskstatus is the run count.
+
+    Args:
+        cube (pandas.DataFrame): Utilization cube, optionally pre-filtered
+        by (list): Keys to group by; None rolls everything up to one row
+
+    Returns:
+        pandas.DataFrame: Rolled-up utilization metrics
+    """
+    measures = ['Runs', 'Utilization_Sum', 'Utilization_Count', 'Idle_Sum', 'Idle_Count', 'Runtime_Sum']
+    if by:
+        rolled = cube.groupby(by, observed=True)[measures].sum().reset_index()
+    else:
+        rolled = cube[measures].sum().to_frame().T
+
+    rolled['Machine_Utilization__'] = rolled['Utilization_Sum'] / rolled['Utilization_Count']
+    rolled['Idle_Percentage__'] = rolled['Idle_Sum'] / rolled['Idle_Count']
+    rolled['SumRuntime_duration__mins_'] = rolled['Runtime_Sum']
+    rolled['desktop_taskstatus'] = rolled['Runs']
+    return drop_unused_categories(rolled)
+
+def total_by(cube, key, measure):
+    """
+    Sum one cube measure per value of a key, largest first
+
+    Args:
+        cube (pandas.DataFrame): Cube, optionally pre-filtered
+        key (str): Key to group by, e.g. 'Status'
+        measure (str): Measure to sum, e.g. 'Runs'
+
+    Returns:
+        pandas.DataFrame: Key and summed measure columns
+    """
+    totals = cube.groupby(key, observed=True)[measure].sum().sort_values(ascending=False).reset_index()
+    return drop_unused_categories(totals)
+
+def rollup_maintenance(cube, by=None):
+    """
+    Roll the maintenance cube up to the given keys
+
+    Args:
+        cube (pandas.DataFrame): Maintenance cube, optionally pre-filtered
+        by (list): Keys to group by; None rolls everything up to one row
+
+    Returns:
+        pandas.DataFrame: Ticket counts, SumMaintenance_Hours, the mean
+        Maintenance_Time_Allocation_Percentage and summed weekly counters
+    """
+    measures = ['Tickets', 'Hours_Sum', 'Allocation_Sum', 'Allocation_Count', 'Weekly_Tickets_Sum', 'Bugs_Completed_Sum']
+    if by:
+        rolled = cube.groupby(by, observed=True)[measures].sum().reset_index()
+    else:
+        rolled = cube[measures].sum().to_frame().T
+
+    rolled['SumMaintenance_Hours'] = rolled['Hours_Sum']
+    rolled['Maintenance_Time_Allocation_Percentage'] = rolled['Allocation_Sum'] / rolled['Allocation_Count']
+    return drop_unused_categories(rolled)
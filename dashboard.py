@@ -0,0 +1,445 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import io
+from collections.abc import Mapping
+from datetime import datetime
+from data_store import (DATA_PATH, EPICS_TABLE, MAINTENANCE_TABLE, UTILIZATION_TABLE,
+                        CORRELATION_TABLE, EPICS_CUBE_TABLE, MAINTENANCE_CUBE_TABLE,
+                        UTILIZATION_CUBE_TABLE, PARTITIONED_TABLES, read_table_cached, table_version,
+                        table_columns)
+from cubes import build_epics_cube, build_maintenance_cube, build_utilization_cube
+
+# Shared by the dashboard pages. Only light dependencies are imported here:
+# plotting, report and export libraries are imported by the page modules
+# that use them, when the page is first opened.
+
+# Constants
+DATA_TABLES = {
+    'epics': EPICS_TABLE,
+    'maintenance': MAINTENANCE_TABLE,
+    'utilization': UTILIZATION_TABLE,
+    'correlation': CORRELATION_TABLE,
+    'epics_cube': EPICS_CUBE_TABLE,
+    'maintenance_cube': MAINTENANCE_CUBE_TABLE,
+    'utilization_cube': UTILIZATION_CUBE_TABLE
+}
+
+# MIME type of Excel downloads
+EXCEL_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Trace fields holding the points of the dashboard's bar, pie, line and timeline charts
+FIGURE_DATA_FIELDS = ('x', 'y', 'values', 'labels')
+
+# Rows the detail tables send to the browser at a time
+TABLE_PAGE_SIZE = 50
+
+# Row background of the detail tables by Status
+STATUS_ROW_COLORS = {
+    'Done': '#e8f5e9',
+    'In Progress': '#e3f2fd',
+    'Development': '#e3f2fd',
+    'Backlog': '#fff3e0',
+    'To Do': '#fff3e0'
+}
+
+# Built figures kept by the figure cache, across every page and filter state
+FIGURE_CACHE_ENTRIES = 256
+
+# Raw table and builder of each cube, used when the store was written by a
+# processor that did not materialize the cubes yet
+CUBE_SOURCES = {
+    'epics_cube': ('epics', build_epics_cube),
+    'maintenance_cube': ('maintenance', build_maintenance_cube),
+    'utilization_cube': ('utilization', build_utilization_cube)
+}
+
+# Directory of the dashboard style sheets
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+# Helper functions
+@st.cache_data
+def load_column(key, version, column, date_range=None, weeks=None):
+    """
+    Load one column of a processed table, cached per table version
+
+    Args:
+        key (str): Table key in DATA_TABLES
+        version (str): Stored version of the table; part of the cache key so
+            new processor outputs invalidate the cache
+        column (str): Column to read
+        date_range (tuple): Optional inclusive (start, end) ISO dates; only
+            rows inside the range are read
+        weeks (tuple): Optional YearWeek keys; week-partitioned tables are
+            read only for these weeks
+    """
+    table = DATA_TABLES[key]
+    table_weeks = weeks if table in PARTITIONED_TABLES else None
+    df = read_table_cached(table, columns=[column], data_path=DATA_PATH, date_range=date_range, weeks=table_weeks)
+    return df[column]
+
+@st.cache_data
+def load_missing_cube(key, source_version, date_range=None):
+    """
+    Build a cube the store has no table for from its raw table
+
+    Args:
+        key (str): Cube key in CUBE_SOURCES
+        source_version (str): Stored version of the raw table; part of the cache key
+        date_range (tuple): Optional inclusive (start, end) ISO dates
+    """
+    source_key, build_cube = CUBE_SOURCES[key]
+    return build_cube(read_table_cached(DATA_TABLES[source_key], data_path=DATA_PATH, date_range=date_range))
+
+class PageData(Mapping):
+    """
+    Lazy handle on the tables a page declared
+
+    A table is loaded on first access with only its declared columns. Each
+    column is cached on its own, so pages sharing a column read it once.
+    """
+
+    def __init__(self, columns, versions, date_range=None, weeks=None):
+        """
+        Args:
+            columns (dict): Table key mapped to its columns, None for every column
+            versions (dict): Table key mapped to its stored version
+            date_range (tuple): Optional inclusive (start, end) ISO dates
+            weeks (tuple): Optional YearWeek keys of the week-partitioned tables
+        """
+        self._columns = columns
+        self._versions = versions
+        self._date_range = date_range
+        self._weeks = weeks
+        self._frames = {}
+
+    def __getitem__(self, key):
+        if key not in self._columns:
+            raise KeyError(key)
+        if key not in self._frames:
+            self._frames[key] = self._load(key)
+        return self._frames[key]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def cache_key(self, keys):
+        """
+        Identify the data a result derived from some of the tables depends on
+
+        Args:
+            keys (list): Table keys the result reads
+
+        Returns:
+            tuple: Versions of those tables, the date range and the weeks
+        """
+        versions = []
+        for key in keys:
+            version = self._versions[key]
+            if version is None:
+                version = table_version(DATA_TABLES[CUBE_SOURCES[key][0]], DATA_PATH)
+            versions.append((key, version))
+        return tuple(versions), self._date_range, self._weeks
+
+    def _load(self, key):
+        table = DATA_TABLES[key]
+        version = self._versions[key]
+        if version is None:
+            source_version = table_version(DATA_TABLES[CUBE_SOURCES[key][0]], DATA_PATH)
+            return load_missing_cube(key, source_version, self._date_range)
+
+        available = table_columns(table, DATA_PATH)
+        columns = self._columns[key]
+        columns = available if columns is None else [col for col in columns if col in available]
+        series = [load_column(key, version, col, self._date_range, self._weeks) for col in columns]
+        return pd.concat(series, axis=1) if series else pd.DataFrame()
+
+def selected_date_range():
+    """
+    Get the date range selected in the sidebar filter
+
+    Returns:
+        tuple: Inclusive (start, end) ISO date strings, or None while no
+        complete range is selected
+    """
+    date_range = st.session_state.get('date_range')
+    if not date_range or len(date_range) != 2:
+        return None
+    return tuple(date.isoformat() for date in date_range)
+
+def load_data(columns=None, weeks=None):
+    """
+    Open a lazy handle on processed data tables
+
+    Args:
+        columns (dict): Table key mapped to the columns a page needs, None
+            for every column; see COLUMNS of the page modules. None declares
+            every table with every column.
+        weeks (list): Optional YearWeek keys to read of the week-partitioned
+            run history tables (e.g. utilization)
+
+    Only rows inside the sidebar date range are loaded.
+
+    Returns:
+        PageData: Tables loaded on first access, or None if a table is missing
+    """
+    try:
+        columns = columns if columns is not None else dict.fromkeys(DATA_TABLES)
+        versions = {}
+        for key in columns:
+            versions[key] = table_version(DATA_TABLES[key], DATA_PATH)
+            if versions[key] is None and key not in CUBE_SOURCES:
+                raise FileNotFoundError(f"Table '{DATA_TABLES[key]}' not found in {DATA_PATH}")
+        weeks = tuple(weeks) if weeks is not None else None
+        return PageData(columns, versions, selected_date_range(), weeks)
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def build_figure_spec(name, data_key, _build):
+    """
+    Build a figure once per data and filter state, shared across sessions
+
+    Args:
+        name (str): Figure name, unique across the app
+        data_key (tuple): Table versions and filters the figure depends on
+        _build (callable): Returns the plotly Figure; not hashed, so name and
+            data_key must identify what it draws
+
+    Returns:
+        dict: Figure spec
+    """
+    return _build().to_dict()
+
+def figure_has_data(spec):
+    """Whether any trace of a figure spec has points to draw"""
+    return any(len(trace.get(field, ())) > 0 for trace in spec.get('data', ())
+               for field in FIGURE_DATA_FIELDS)
+
+def plot_cached(data, name, tables, build, **filters):
+    """
+    Show a figure from the figure cache, building it only when its inputs changed
+    
+    The figure's tables are not loaded when the cached figure is reused.
+    
+    Args:
+        data (PageData): Page data handle
+        name (str): Figure name, unique across the app
+        tables (list): Table keys the figure reads
+        build (callable): Returns the plotly Figure
+        **filters: Page widget values the figure depends on
+    """
+    data_key = (data.cache_key(tables), tuple(sorted(filters.items())))
+    spec = build_figure_spec(name, data_key, build)
+    # Plotly rejects figures without traces, as built for a date range without rows
+    if figure_has_data(spec):
+        st.plotly_chart(spec, use_container_width=True)
+    else:
+        st.info("No data in the selected range")
+
+def row_color_styles(df, column, colors):
+    """
+    Color whole rows by the value of one column
+    
+    Args:
+        df (pandas.DataFrame): Rows to style
+        column (str): Column whose value picks the color
+        colors (dict): Column value mapped to a background color
+    
+    Returns:
+        pandas.DataFrame: CSS of every cell, for Styler.apply with axis=None
+    """
+    css = {value: f'background-color: {color}' for value, color in colors.items()}
+    row_css = df[column].astype(object).map(css).fillna('').to_numpy()
+    return pd.DataFrame(np.repeat(row_css[:, None], len(df.columns), axis=1), index=df.index, columns=df.columns)
+
+@st.fragment
+def paged_table(df, key, sort_column, ascending=False, color_column=None, colors=None, page_size=TABLE_PAGE_SIZE):
+    """
+    Show a table one page at a time, sorted and styled on the server
+    
+    Only the visible page is styled and sent to the browser. Paging and
+    sorting rerun only the table.
+    
+    Args:
+        df (pandas.DataFrame): All rows of the table
+        key (str): Widget key prefix, unique on the page
+        sort_column (str): Column sorted by initially
+        ascending (bool): Initial sort order
+        color_column (str): Optional column whose value colors each row
+        colors (dict): color_column value mapped to a background color
+        page_size (int): Rows per page
+    """
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_by = st.selectbox("Sort by", list(df.columns), index=list(df.columns).index(sort_column),
+                               key=f"{key}_sort")
+    with col2:
+        order = st.selectbox("Order", ["Descending", "Ascending"], index=int(ascending), key=f"{key}_order")
+    
+    pages = max(1, -(-len(df) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with col3:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=page_key)
+    
+    start = (page - 1) * page_size
+    # Categorical columns sort by value rather than by category order
+    page_df = df.sort_values(sort_by, ascending=order == "Ascending", kind='stable',
+                             key=lambda col: col.astype(object) if isinstance(col.dtype, pd.CategoricalDtype) else col)
+    page_df = page_df.iloc[start:start + page_size]
+    
+    if color_column is not None:
+        page_df = page_df.style.apply(row_color_styles, axis=None, column=color_column, colors=colors)
+    st.dataframe(page_df, height=400, use_container_width=True)
+    st.caption(f"Rows {min(start + 1, len(df))}-{min(start + page_size, len(df))} of {len(df)}")
+
+def create_metric_card(label, value, prefix="", suffix="", color="#1E88E5", help_text=None):
+    """Create a styled metric card"""
+    # Ensure label is never empty for accessibility
+    if not label or label.strip() == "":
+        label = "Metric"
+        
+    if help_text:
+        label = f"{label} ℹ️"
+        
+    st.markdown(f"""
+    <div class="metric-card">
+        <div class="metric-value" style="color: {color};">{prefix}{value}{suffix}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if help_text:
+        metric_help(label, value, help_text)
+
+@st.fragment
+def metric_help(label, value, help_text):
+    """Show a metric card's help text on request, without rerunning the page"""
+    if st.checkbox(f"More info on {label}", False, key=f"help_{label}_{value}".replace(" ", "_")):
+        st.info(help_text)
+
+def lazy_download_button(label, build, file_name, mime, key):
+    """
+    Offer a download whose content is built only when the user asks for it
+    
+    The first click prepares the file and shows a download button serving it
+    as binary, so the file is neither rebuilt nor embedded in the page on
+    every rerun.
+    
+    Args:
+        label (str): Name of the download, e.g. "Excel Report"
+        build (callable): Returns the file content as bytes
+        file_name (str): Name the file is downloaded as
+        mime (str): MIME type of the file
+        key (str): Widget key, unique on the page
+    """
+    if st.button(f"Prepare {label}", key=f"{key}_prepare"):
+        with st.spinner(f"Preparing {file_name}..."):
+            data = build()
+        st.download_button(label=f"Download {label}", data=data, file_name=file_name, mime=mime, key=key)
+
+def excel_bytes(dataframes):
+    """Write DataFrames to an in-memory Excel workbook, one sheet each"""
+    # openpyxl is only imported once a workbook is actually requested
+    from excel_export import write_sheets
+    buffer = io.BytesIO()
+    write_sheets(dataframes, buffer)
+    return buffer.getvalue()
+
+def create_downloadable_excel(build_dataframes, filename="dashboard_data.xlsx", key="dashboard_excel"):
+    """
+    Offer a multi-sheet Excel download, generated only when requested
+    
+    Args:
+        build_dataframes (callable): Returns sheet names mapped to DataFrames
+        filename (str): Name the workbook is downloaded as
+        key (str): Widget key, unique on the page
+    """
+    lazy_download_button("Excel File", lambda: excel_bytes(build_dataframes()), filename, EXCEL_MIME, key)
+
+def generate_email_template(kpis, insights, recommendations):
+    """Generate an email template for management reporting"""
+    current_date = datetime.now().strftime("%B %d, %Y")
+    
+    email_template = f"""
+    Subject: LTR Weekly Performance Report - Week 16, 2025
+    
+    Dear Management Team,
+    
+    I hope this email finds you well. Please find below the key performance indicators and insights from our automation and project management systems for the week ending April 21, 2025.
+    
+    **KEY PERFORMANCE INDICATORS:**
+    
+    """
+    
+    # Add KPIs
+    for kpi, value in kpis.items():
+        email_template += f"- {kpi}: {value}\n"
+    
+    email_template += """
+    
+    **KEY INSIGHTS:**
+    
+    """
+    
+    # Add insights
+    for insight in insights:
+        email_template += f"- {insight}\n"
+    
+    email_template += """
+    
+    **RECOMMENDATIONS:**
+    
+    """
+    
+    # Add recommendations
+    for recommendation in recommendations:
+        email_template += f"- {recommendation}\n"
+    
+    email_template += """
+    
+    The complete dashboard with detailed analytics is available for your review. Please let me know if you need any clarification or have questions about specific metrics.
+    
+    Best regards,
+    
+    [Your Name]
+    Automation Team Lead
+    """
+    
+    return email_template
+
+@st.cache_resource(show_spinner=False)
+def stylesheet(*names):
+    """
+    Read style sheets into one style element, once per process
+
+    Args:
+        *names (str): Style sheet file names in STYLES_DIR
+
+    Returns:
+        str: HTML style element
+    """
+    css = []
+    for name in names:
+        with open(os.path.join(STYLES_DIR, name), encoding='utf-8') as f:
+            css.append(f.read())
+    return "<style>\n" + "\n".join(css) + "</style>"
+
+def inject_css(*names):
+    """
+    Apply style sheets to the page
+    
+    Streamlit drops the elements a run does not draw again, so this is called
+    on every run; the sheets are read and joined only on the first one.
+    
+    Args:
+        *names (str): Style sheet file names in STYLES_DIR
+    """
+    st.markdown(stylesheet(*names), unsafe_allow_html=True)
@@ -0,0 +1,32 @@
+import sys
+import time
+import importlib
+
+# Module and function of each dashboard page, in navigation order. A page's
+# module, and the plotting, report and export libraries it uses, are imported
+# the first time the page is opened rather than when the app starts.
+PAGES = {
+    "Summary Overview": ("dashboard_pages.summary", "summary_overview_page"),
+    "JIRA Epics Analysis": ("dashboard_pages.epics", "jira_epics_analysis_page"),
+    "Maintenance Analysis": ("dashboard_pages.maintenance", "maintenance_analysis_page"),
+    "Machine Utilization": ("dashboard_pages.utilization", "machine_utilization_page"),
+    "Report Generator": ("dashboard_pages.reports", "report_generator_page")
+}
+
+# Page shown when none, or an unknown one, is selected
+DEFAULT_PAGE = "Summary Overview"
+
+def load_page(page):
+    """
+    Import a page's module, once per process
+
+    Args:
+        page (str): Key of PAGES; unknown pages load DEFAULT_PAGE
+
+    Returns:
+        tuple: (page function, seconds spent importing its module, about 0 once loaded)
+    """
+    module_name, function_name = PAGES.get(page, PAGES[DEFAULT_PAGE])
+    start = time.perf_counter()
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, function_name), time.perf_counter() - start
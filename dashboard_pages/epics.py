@@ -0,0 +1,144 @@
+import streamlit as st
+import plotly.express as px
+from data_store import drop_unused_categories
+from dashboard import STATUS_ROW_COLORS, load_data, plot_cached, paged_table
+
+# Tables and columns the page reads; a None column list reads every column
+COLUMNS = {
+    'epics': ['Key', 'summary', 'Status', 'priority', 'Assignee', 'created', 'Start Date',
+              'Completed Date', 'Estimated Financial Impact']
+}
+
+def jira_epics_analysis_page():
+    st.markdown('<div class="main-header">LTR Data Dashboard - JIRA Epics Analysis</div>', unsafe_allow_html=True)
+    
+    data = load_data(COLUMNS)
+    if not data:
+        st.error("Failed to load data. Please check the data files.")
+        return
+    
+    epics_df = data['epics']
+
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            options=sorted(epics_df['Status'].unique()),
+            default=sorted(epics_df['Status'].unique()),
+            key="status_filter"
+        )
+    with col2:
+        priority_filter = st.multiselect(
+            "Filter by Priority",
+            options=sorted(epics_df['priority'].unique()),
+            default=sorted(epics_df['priority'].unique()),
+            key="priority_filter"
+        )
+    with col3:
+        assignee_filter = st.multiselect(
+            "Filter by Assignee",
+            options=sorted(epics_df['Assignee'].unique()),
+            default=sorted(epics_df['Assignee'].unique()),
+            key="assignee_filter"
+        )
+    
+    # Apply filters; on the categorical columns isin compares integer codes
+    filtered_df = drop_unused_categories(epics_df[
+        epics_df['Status'].isin(status_filter) &
+        epics_df['priority'].isin(priority_filter) &
+        epics_df['Assignee'].isin(assignee_filter)
+    ])
+    
+    # JIRA Epics Timeline
+    st.markdown('<div class="sub-header">JIRA Epics Timeline</div>', unsafe_allow_html=True)
+    
+    # Figures depend on the epics table and the filter selections
+    filter_state = dict(status=tuple(status_filter), priority=tuple(priority_filter),
+                        assignee=tuple(assignee_filter))
+    
+    # Create color mapping for status
+    color_map = {
+        'Done': '#4caf50',
+        'In Progress': '#2196f3',
+        'Development': '#2196f3',
+        'Backlog': '#9e9e9e',
+        'To Do': '#9e9e9e'
+    }
+    
+    if not filtered_df.empty:
+        # Create timeline chart
+        def timeline_figure():
+            timeline_df = filtered_df.sort_values('created')
+            
+            # Determine task completion
+            timeline_df['completed'] = timeline_df['Status'] == 'Done'
+            
+            fig = px.timeline(
+                timeline_df,
+                x_start='Start Date',
+                x_end='Completed Date',
+                y='Key',
+                color='Status',
+                hover_name='summary',
+                hover_data=['priority', 'Assignee'],
+                color_discrete_map=color_map,
+                title='JIRA Epics Timeline'
+            )
+            
+            fig.update_layout(height=500)
+            return fig
+        
+        plot_cached(data, 'epics_timeline', ['epics'], timeline_figure, **filter_state)
+    else:
+        st.warning("No epics match the selected filters.")
+    
+    # Epics Details Table
+    st.markdown('<div class="sub-header">JIRA Epics Details</div>', unsafe_allow_html=True)
+    
+    # Select columns for display
+    display_cols = ['Key', 'summary', 'Status', 'priority', 'Assignee', 'created', 'Completed Date', 'Estimated Financial Impact']
+    
+    # Rows are colored by status
+    paged_table(filtered_df[display_cols], 'epics_table', 'created', color_column='Status', colors=STATUS_ROW_COLORS)
+    
+    # Financial Impact Analysis
+    st.markdown('<div class="sub-header">Financial Impact Analysis</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Financial Impact by Status
+        def impact_by_status_figure():
+            fin_impact_by_status = filtered_df.groupby('Status', observed=True)['Estimated Financial Impact'].sum().reset_index()
+            fin_impact_by_status = fin_impact_by_status.sort_values('Estimated Financial Impact', ascending=False)
+            
+            fig = px.bar(
+                fin_impact_by_status,
+                x='Status',
+                y='Estimated Financial Impact',
+                color='Status',
+                color_discrete_map=color_map,
+                title='Estimated Financial Impact by Status'
+            )
+            fig.update_layout(height=400)
+            return fig
+        
+        plot_cached(data, 'epics_impact_by_status', ['epics'], impact_by_status_figure, **filter_state)
+    
+    with col2:
+        # Financial Impact by Assignee
+        def impact_by_assignee_figure():
+            fin_impact_by_assignee = filtered_df.groupby('Assignee', observed=True)['Estimated Financial Impact'].sum().reset_index()
+            fin_impact_by_assignee = fin_impact_by_assignee.sort_values('Estimated Financial Impact', ascending=False)
+            
+            fig = px.pie(
+                fin_impact_by_assignee,
+                names='Assignee',
+                values='Estimated Financial Impact',
+                title='Estimated Financial Impact by Assignee'
+            )
+            fig.update_layout(height=400)
+            return fig
+        
+        plot_cached(data, 'epics_impact_by_assignee', ['epics'], impact_by_assignee_figure, **filter_state)
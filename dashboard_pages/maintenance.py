@@ -0,0 +1,119 @@
+import streamlit as st
+import plotly.express as px
+from dashboard import load_data, plot_cached, paged_table, create_metric_card
+from cubes import rollup_maintenance, total_by
+
+# Tables and columns the page reads; a None column list reads every column
+COLUMNS = {
+    'maintenance': ['Key', 'summary', 'Issue Type', 'Status', 'priority', 'created', 'Completed Date',
+                    'SumMaintenance_Hours', 'Reason for Failure', 'Bug_Completed_Count_Last_Week'],
+    'maintenance_cube': None
+}
+
+def maintenance_analysis_page():
+    st.markdown('<div class="main-header">LTR Data Dashboard - Maintenance Analysis</div>', unsafe_allow_html=True)
+    
+    data = load_data(COLUMNS)
+    if not data:
+        st.error("Failed to load data. Please check the data files.")
+        return
+    
+    maintenance_df = data['maintenance']
+    maintenance_cube = data['maintenance_cube']
+    maintenance_totals = rollup_maintenance(maintenance_cube).iloc[0]
+    
+    # Maintenance KPIs
+    st.markdown('<div class="sub-header">Maintenance Key Metrics</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_maintenance_hours = maintenance_totals['SumMaintenance_Hours']
+        create_metric_card("Total Maintenance Hours", f"{total_maintenance_hours:.1f}", color="#ff9800")
+    
+    with col2:
+        avg_maintenance_allocation = maintenance_totals['Maintenance_Time_Allocation_Percentage'] * 100
+        create_metric_card("Avg Time Allocation", f"{avg_maintenance_allocation:.1f}%", color="#ff9800")
+    
+    with col3:
+        total_maintenance_tickets = maintenance_totals['Weekly_Tickets_Sum']
+        create_metric_card("Total Tickets", f"{int(total_maintenance_tickets)}", color="#ff9800")
+    
+    with col4:
+        if 'Bug_Completed_Count_Last_Week' in maintenance_df.columns:
+            bug_completion = maintenance_totals['Bugs_Completed_Sum']
+            create_metric_card("Bugs Fixed Last Week", f"{int(bug_completion)}", color="#ff9800")
+        else:
+            create_metric_card("Bugs Fixed Last Week", "N/A", color="#ff9800")
+    
+    # Maintenance Activity Analysis
+    st.markdown('<div class="sub-header">Maintenance Activity Analysis</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Maintenance by Issue Type
+        if 'Issue Type' in maintenance_cube.columns:
+            def issue_type_figure():
+                issue_type_counts = total_by(maintenance_cube, 'Issue Type', 'Tickets')
+                issue_type_counts.columns = ['Issue Type', 'Count']
+                
+                fig = px.pie(
+                    issue_type_counts,
+                    names='Issue Type',
+                    values='Count',
+                    title='Maintenance by Issue Type'
+                )
+                fig.update_layout(height=400)
+                return fig
+            
+            plot_cached(data, 'maintenance_by_issue_type', ['maintenance_cube'], issue_type_figure)
+        else:
+            st.warning("Issue Type data not available")
+    
+    with col2:
+        # Maintenance Hours by Priority
+        if 'priority' in maintenance_cube.columns:
+            def hours_by_priority_figure():
+                maintenance_by_priority = rollup_maintenance(maintenance_cube, by=['priority'])
+                maintenance_by_priority = maintenance_by_priority.sort_values('SumMaintenance_Hours', ascending=False)
+                
+                fig = px.bar(
+                    maintenance_by_priority,
+                    x='priority',
+                    y='SumMaintenance_Hours',
+                    color='priority',
+                    title='Maintenance Hours by Priority'
+                )
+                fig.update_layout(height=400)
+                return fig
+            
+            plot_cached(data, 'maintenance_hours_by_priority', ['maintenance_cube'], hours_by_priority_figure)
+        else:
+            st.warning("Priority data not available")
+    
+    # Maintenance Tickets Details
+    st.markdown('<div class="sub-header">Maintenance Tickets Details</div>', unsafe_allow_html=True)
+    
+    # Select relevant columns
+    display_cols = [col for col in ['Key', 'summary', 'Issue Type', 'Status', 'priority', 
+                                  'created', 'Completed Date', 'SumMaintenance_Hours', 'Reason for Failure'] 
+                   if col in maintenance_df.columns]
+    
+    if display_cols:
+        paged_table(maintenance_df[display_cols], 'maintenance_table', 'created')
+    else:
+        st.warning("No suitable data for display")
+
+    # Maintenance Recommendations
+    st.markdown('<div class="sub-header">Maintenance Insights & Recommendations</div>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
+    st.markdown("<b>Maintenance Recommendations:</b>", unsafe_allow_html=True)
+    st.markdown("""
+    - Focus on resolving the highest priority maintenance items first
+    - Schedule routine maintenance to reduce unplanned downtime
+    - Document common failure patterns to prevent recurring issues
+    - Implement automated monitoring for early issue detection
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,377 @@
+import streamlit as st
+import os
+from datetime import datetime
+from data_store import DATA_PATH, UTILIZATION_TABLE, partition_weeks
+from dashboard import EXCEL_MIME, load_data, lazy_download_button, excel_bytes, inject_css
+from report_engine import (REPORT_COLUMNS, REPORT_FILE_STEMS, REPORT_HTML_RENDERERS,
+                           generate_comprehensive_report, generate_rpa_ltr_report,
+                           generate_kaluza_ltr_report, report_excel_sheets)
+from excel_export import write_sheets
+from template_engine import write_report
+
+# Tables and columns the page reads; a None column list reads every column
+COLUMNS = REPORT_COLUMNS
+
+# Weeks of run history the LTR reports cover: the latest week plus a trailing window
+LTR_REPORT_WEEKS = 4
+
+def save_report_to_file(report, output_dir="reports"):
+    """
+    Save the report to both HTML and Excel formats in the specified directory
+    """
+    try:
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Generate timestamp for filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Save HTML report
+        html_filename = f"ltr_report_{timestamp}.html"
+        write_report("Standard Report", report, os.path.join(output_dir, html_filename))
+        
+        # Save Excel report
+        excel_filename = f"ltr_report_{timestamp}.xlsx"
+        write_sheets(report_excel_sheets("Standard Report", report), os.path.join(output_dir, excel_filename))
+        
+        return html_filename, excel_filename
+    except Exception as e:
+        st.error(f"Error saving report: {e}")
+        return None, None
+
+def generate_automated_report():
+    """
+    Generate and save a report automatically
+    """
+    try:
+        # Load data
+        data = load_data(REPORT_COLUMNS)
+        if data is None:
+            st.error("Failed to load data. Please check the data files.")
+            return
+        
+        # Generate report
+        report = generate_comprehensive_report(data)
+        
+        # Save report
+        html_file, excel_file = save_report_to_file(report)
+        
+        if html_file and excel_file:
+            st.success(f"Report generated successfully!")
+            st.info(f"HTML report saved as: {html_file}")
+            st.info(f"Excel report saved as: {excel_file}")
+        else:
+            st.error("Failed to save report files.")
+    except Exception as e:
+        st.error(f"Error generating automated report: {e}")
+
+def select_report_type(report_type):
+    """Report type button callback"""
+    st.session_state.selected_report_type = report_type
+
+def report_generator_page():
+    """Enhanced report generator page with comprehensive analysis"""
+    st.title("📝 Report Generator")
+    
+    # Add custom CSS for the report type buttons
+    inject_css("report_generator.css")
+    
+    # Initialize session state for selected report type if not exists
+    if 'selected_report_type' not in st.session_state:
+        st.session_state.selected_report_type = "Standard Report"
+    
+    # Report type selection
+    st.markdown("### Select Report Type")
+    
+    # Create a container for the cards
+    st.markdown('<div class="report-type-container">', unsafe_allow_html=True)
+    
+    # Standard Report Card
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        is_standard = st.session_state.selected_report_type == "Standard Report"
+        st.markdown(f"""
+        <div class="report-type-card {'selected' if is_standard else ''}">
+            <div class="report-type-icon">📊</div>
+            <div class="report-type-title">Standard Report</div>
+            <div class="report-type-desc">Comprehensive analysis with detailed metrics and insights</div>
+            <div class="report-type-features">
+                <ul>
+                    <li>📈 Performance metrics and KPIs</li>
+                    <li>📊 Data source analysis</li>
+                    <li>💡 Key insights and trends</li>
+                    <li>🎯 Actionable recommendations</li>
+                    <li>📋 Detailed breakdowns</li>
+                </ul>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.button("Select Standard Report", key="btn_standard", use_container_width=True,
+                  on_click=select_report_type, args=("Standard Report",))
+    
+    # RPA LTR Report Card
+    with col2:
+        is_rpa = st.session_state.selected_report_type == "RPA LTR Report"
+        st.markdown(f"""
+        <div class="report-type-card {'selected' if is_rpa else ''}">
+            <div class="report-type-icon">🤖</div>
+            <div class="report-type-title">RPA LTR Report</div>
+            <div class="report-type-desc">RPA-focused updates with detailed roadmap and metrics</div>
+            <div class="report-type-features">
+                <ul>
+                    <li>🤖 Bot performance metrics</li>
+                    <li>📅 Project timeline updates</li>
+                    <li>📈 ROI and efficiency analysis</li>
+                    <li>🔧 Maintenance insights</li>
+                    <li>🎯 Future roadmap items</li>
+                </ul>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.button("Select RPA Report", key="btn_rpa", use_container_width=True,
+                  on_click=select_report_type, args=("RPA LTR Report",))
+    
+    # Kaluza LTR Report Card
+    with col3:
+        is_kaluza = st.session_state.selected_report_type == "Kaluza LTR Report"
+        st.markdown(f"""
+        <div class="report-type-card {'selected' if is_kaluza else ''}">
+            <div class="report-type-icon">📈</div>
+            <div class="report-type-title">Kaluza LTR Report</div>
+            <div class="report-type-desc">Kaluza-specific metrics with detailed analysis</div>
+            <div class="report-type-features">
+                <ul>
+                    <li>📊 Kaluza-specific KPIs</li>
+                    <li>📈 Performance trends</li>
+                    <li>💡 Strategic insights</li>
+                    <li>🎯 Implementation updates</li>
+                    <li>📋 Detailed metrics</li>
+                </ul>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.button("Select Kaluza Report", key="btn_kaluza", use_container_width=True,
+                  on_click=select_report_type, args=("Kaluza LTR Report",))
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    if st.session_state.selected_report_type == "Standard Report":
+        data = load_data(COLUMNS)
+    else:
+        # LTR reports only need the latest weeks of run history
+        history_weeks = partition_weeks(UTILIZATION_TABLE, DATA_PATH)
+        ltr_weeks = history_weeks[-LTR_REPORT_WEEKS:] if history_weeks else None
+        data = load_data(COLUMNS, weeks=ltr_weeks)
+    if data is None:
+        st.error("Failed to load data. Please check the data files.")
+        return
+    
+    # Generate report based on selected type
+    if st.session_state.selected_report_type == "Standard Report":
+        report = generate_comprehensive_report(data)
+        display_standard_report(report)
+        download_standard_report(report)
+    elif st.session_state.selected_report_type == "RPA LTR Report":
+        report = generate_rpa_ltr_report(data)
+        display_rpa_ltr_report(report)
+        download_rpa_ltr_report(report)
+    else:  # Kaluza LTR Report
+        report = generate_kaluza_ltr_report(data)
+        display_kaluza_ltr_report(report)
+        download_kaluza_ltr_report(report)
+
+@st.fragment
+def download_report(report_type, report):
+    """Download a report in HTML and Excel formats; preparing a file reruns only this section"""
+    st.markdown("### Download Report")
+    col1, col2 = st.columns(2)
+    file_stem = REPORT_FILE_STEMS[report_type]
+    
+    with col1:
+        # Download as HTML
+        html_report = REPORT_HTML_RENDERERS[report_type](report)
+        st.download_button(
+            label="Download HTML Report",
+            data=html_report,
+            file_name=f"{file_stem}.html",
+            mime="text/html"
+        )
+    
+    with col2:
+        # Download as Excel, built only when requested
+        lazy_download_button("Excel Report", lambda: excel_bytes(report_excel_sheets(report_type, report)),
+                             f"{file_stem}.xlsx", EXCEL_MIME, key="report_excel")
+
+def download_standard_report(report):
+    """Download standard report in HTML and Excel formats"""
+    download_report("Standard Report", report)
+
+def download_rpa_ltr_report(report):
+    """Download RPA LTR report in HTML and Excel formats"""
+    download_report("RPA LTR Report", report)
+
+def download_kaluza_ltr_report(report):
+    """Download Kaluza LTR report in HTML and Excel formats"""
+    download_report("Kaluza LTR Report", report)
+
+def display_standard_report(report):
+    """Display standard report in Streamlit"""
+    st.markdown("## 📊 Comprehensive Data Analysis Report")
+    st.markdown(f"*Generated on: {report['timestamp']}*")
+    
+    # Data Sources Analysis
+    with st.expander("Data Sources Analysis", expanded=True):
+        st.markdown("### JIRA Epics")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Records", report['data_sources']['jira_epics']['total_records'])
+            st.metric("Completion Rate", f"{report['data_sources']['jira_epics']['completion_rate']:.1f}%")
+        with col2:
+            date_range = report['data_sources']['jira_epics']['date_range']
+            st.metric("Date Range", f"{date_range['start'] or 'N/A'} to {date_range['end'] or 'N/A'}")
+            st.metric("Average Cycle Time", f"{report['data_sources']['jira_epics']['avg_cycle_time']:.1f} days")
+        
+        st.markdown("### Maintenance Data")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Records", report['data_sources']['maintenance']['total_records'])
+            st.metric("Total Maintenance Hours", f"{report['data_sources']['maintenance']['total_hours']:.1f}")
+        with col2:
+            st.metric("Average Tickets/Week", f"{report['data_sources']['maintenance']['avg_tickets_per_week']:.1f}")
+            st.metric("Maintenance Allocation", f"{report['data_sources']['maintenance']['maintenance_allocation']:.1f}%")
+        
+        st.markdown("### Machine Utilization")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Records", report['data_sources']['utilization']['total_records'])
+            st.metric("Average Utilization", f"{report['data_sources']['utilization']['avg_utilization_rate']:.1f}%")
+        with col2:
+            st.metric("Total Available Hours", f"{report['data_sources']['utilization']['total_available_hours']:.1f}")
+            st.metric("Total Utilized Hours", f"{report['data_sources']['utilization']['total_utilized_hours']:.1f}")
+    
+    # Key Metrics
+    with st.expander("Key Metrics", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Overall Efficiency", f"{report['metrics']['overall_efficiency']:.1f}%")
+        with col2:
+            st.metric("Maintenance Impact", f"{report['metrics']['maintenance_impact']:.1f}%")
+        with col3:
+            st.metric("Epic Completion Rate", f"{report['metrics']['epic_completion_rate']:.1f}%")
+    
+    # Insights
+    with st.expander("Insights", expanded=True):
+        for insight in report['insights']:
+            st.info(insight)
+    
+    # Recommendations
+    with st.expander("Recommendations", expanded=True):
+        for recommendation in report['recommendations']:
+            st.success(recommendation)
+
+def display_rpa_ltr_report(report):
+    """Display RPA LTR report in Streamlit"""
+    st.markdown("## 📊 RPA LTR Report")
+    st.markdown(f"*Generated on: {report['timestamp']}*")
+    
+    # Key Updates
+    with st.expander("Key Updates", expanded=True):
+        for update in report['key_updates']:
+            st.markdown(f"### {update['title']}")
+            st.markdown(f"- Impact: {update['impact']}")
+            st.markdown(f"- Date: {update['date']}")
+    
+    # Exec LTR View
+    with st.expander("Exec LTR View", expanded=True):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Completion Rate", f"{report['exec_ltr_view']['completion_rate']:.1f}%")
+        with col2:
+            st.metric("Avg Utilization", f"{report['exec_ltr_view']['avg_utilization']:.1f}%")
+        with col3:
+            st.metric("Maintenance Impact", f"{report['exec_ltr_view']['maintenance_impact']:.1f} hours")
+        with col4:
+            st.metric("Success Rate", f"{report['exec_ltr_view']['success_rate']:.1f}%")
+    
+    # Roadmap Updates
+    with st.expander("Roadmap & Next Steps", expanded=True):
+        for update in report['roadmap_updates']:
+            st.markdown(f"### {update['title']}")
+            st.markdown(f"- Due Date: {update['due_date']}")
+            st.markdown(f"- Owner: {update['owner']}")
+            st.markdown(f"- Impact: {update['impact']}")
+    
+    # Detail Notes
+    with st.expander("Detail Notes", expanded=True):
+        for note in report['detail_notes']:
+            st.markdown(f"- {note}")
+    
+    # Deep Dives
+    with st.expander("Deep Dives", expanded=True):
+        for dive in report['deep_dives']:
+            st.markdown(f"### {dive['title']}")
+            st.markdown(f"- Status: {dive['status']}")
+            st.markdown(f"- Priority: {dive['priority']}")
+    
+    # Files
+    with st.expander("Files", expanded=True):
+        for file in report['files']:
+            st.markdown(f"- {file}")
+
+def display_kaluza_ltr_report(report):
+    """Display Kaluza LTR report in Streamlit"""
+    st.markdown("## 📊 Kaluza LTR Report")
+    st.markdown(f"*Generated on: {report['timestamp']}*")
+    
+    # Line Items
+    with st.expander("Line Items", expanded=True):
+        for item in report['line_items']:
+            st.markdown(f"### {item['description']}")
+            st.markdown(f"- Definition: {item['definition']}")
+            st.markdown(f"- Owner: {item['owner']}")
+            st.markdown(f"- Goal: {item['goal']}%")
+            st.markdown(f"- Current Value: {item['current_value']:.1f}%")
+    
+    # Key Updates
+    with st.expander("Key Updates", expanded=True):
+        for update in report['key_updates']:
+            st.markdown(f"### {update['title']}")
+            st.markdown(f"- Impact: {update['impact']}")
+            st.markdown(f"- Date: {update['date']}")
+    
+    # Exec LTR View
+    with st.expander("Exec LTR View", expanded=True):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Completion Rate", f"{report['exec_ltr_view']['completion_rate']:.1f}%")
+        with col2:
+            st.metric("Avg Utilization", f"{report['exec_ltr_view']['avg_utilization']:.1f}%")
+        with col3:
+            st.metric("Maintenance Impact", f"{report['exec_ltr_view']['maintenance_impact']:.1f} hours")
+        with col4:
+            st.metric("Success Rate", f"{report['exec_ltr_view']['success_rate']:.1f}%")
+    
+    # Roadmap Updates
+    with st.expander("Roadmap & Next Steps", expanded=True):
+        for update in report['roadmap_updates']:
+            st.markdown(f"### {update['title']}")
+            st.markdown(f"- Due Date: {update['due_date']}")
+            st.markdown(f"- Owner: {update['owner']}")
+            st.markdown(f"- Impact: {update['impact']}")
+    
+    # Detail Notes
+    with st.expander("Detail Notes", expanded=True):
+        for note in report['detail_notes']:
+            st.markdown(f"- {note}")
+    
+    # Deep Dives
+    with st.expander("Deep Dives", expanded=True):
+        for dive in report['deep_dives']:
+            st.markdown(f"### {dive['title']}")
+            st.markdown(f"- Status: {dive['status']}")
+            st.markdown(f"- Priority: {dive['priority']}")
+    
+    # Files
+    with st.expander("Files", expanded=True):
+        for file in report['files']:
+            st.markdown(f"- {file}")
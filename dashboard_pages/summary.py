@@ -0,0 +1,195 @@
+import streamlit as st
+import plotly.express as px
+from plotly.subplots import make_subplots
+from dashboard import load_data, plot_cached, create_metric_card
+from cubes import rollup_utilization, total_by
+from timeseries import TIME_RESOLUTIONS, count_trace, line_trace, utilization_over_time
+
+# Tables and columns the page reads; a None column list reads every column
+COLUMNS = {
+    'epics_cube': None,
+    'utilization_cube': None,
+    'correlation': ['Maintenance_Time_Allocation_Percentage', 'Desktop_Run_Percent_Success']
+}
+
+def summary_overview_page():
+    st.markdown('<div class="main-header">LTR Data Dashboard - Summary Overview</div>', unsafe_allow_html=True)
+    
+    data = load_data(COLUMNS)
+    if not data:
+        st.error("Failed to load data. Please check the data files.")
+        return
+    
+    # Extract key metrics
+    epics_cube = data['epics_cube']
+    utilization_cube = data['utilization_cube']
+    correlation_df = data['correlation']
+    
+    # KPIs Row
+    st.markdown('<div class="sub-header">Key Performance Indicators</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_epics = epics_cube['Epics'].sum()
+        completed_epics = epics_cube.loc[epics_cube['Status'] == 'Done', 'Epics'].sum()
+        completion_rate = round((completed_epics / total_epics) * 100, 1) if total_epics > 0 else 0
+        create_metric_card("Completion Rate", f"{completion_rate}%", color="#43a047", 
+                          help_text="Percentage of completed epics relative to total epics")
+    
+    with col2:
+        # Machine utilization
+        avg_utilization = rollup_utilization(utilization_cube)['Machine_Utilization__'].iloc[0] * 100
+        create_metric_card("Avg Machine Utilization", f"{avg_utilization:.1f}%", color="#1e88e5",
+                          help_text="Average percentage of time machines are actively running tasks")
+    
+    with col3:
+        # Maintenance allocation
+        if 'Maintenance_Time_Allocation_Percentage' in correlation_df.columns:
+            maint_allocation = correlation_df['Maintenance_Time_Allocation_Percentage'].mean() * 100
+            create_metric_card("Maintenance Allocation", f"{maint_allocation:.1f}%", color="#ff9800",
+                              help_text="Percentage of time allocated to maintenance activities")
+        else:
+            create_metric_card("Maintenance Allocation", "N/A", color="#ff9800")
+    
+    with col4:
+        # Success rate
+        if 'Desktop_Run_Percent_Success' in correlation_df.columns:
+            success_rate = correlation_df['Desktop_Run_Percent_Success'].mean() * 100
+            create_metric_card("Bot Success Rate", f"{success_rate:.1f}%", color="#43a047",
+                              help_text="Percentage of bot runs that completed successfully")
+        else:
+            total_runs = utilization_cube['Runs'].sum()
+            success_runs = utilization_cube.loc[utilization_cube['desktop_taskstatus'] == 'Succeeded', 'Runs'].sum()
+            success_rate = success_runs / total_runs * 100 if total_runs > 0 else 0
+            create_metric_card("Bot Success Rate", f"{success_rate:.1f}%", color="#43a047")
+    
+    # Project Status Chart
+    st.markdown('<div class="sub-header">Project Status Overview</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Status distribution
+        def status_figure():
+            status_counts = total_by(epics_cube, 'Status', 'Epics')
+            status_counts.columns = ['Status', 'Count']
+            
+            fig = px.bar(status_counts, x='Status', y='Count', 
+                        title='Epic Status Distribution',
+                        color='Status',
+                        color_discrete_map={
+                            'Done': '#4caf50',
+                            'In Progress': '#2196f3',
+                            'Development': '#2196f3',
+                            'Backlog': '#9e9e9e',
+                            'To Do': '#9e9e9e'
+                        })
+            fig.update_layout(height=400)
+            return fig
+        
+        plot_cached(data, 'summary_epic_status', ['epics_cube'], status_figure)
+    
+    with col2:
+        # Priority distribution
+        def priority_figure():
+            priority_counts = total_by(epics_cube, 'priority', 'Epics')
+            priority_counts.columns = ['Priority', 'Count']
+            
+            fig = px.pie(priority_counts, names='Priority', values='Count',
+                        title='Epic Priority Distribution',
+                        color='Priority',
+                        color_discrete_map={
+                            'Highest (P1)': '#f44336',
+                            'High (P2)': '#ff9800',
+                            'Medium (P3)': '#ffeb3b',
+                            'Low (P4)': '#4caf50',
+                            'Lowest (P5)': '#2196f3'
+                        })
+            fig.update_layout(height=400)
+            return fig
+        
+        plot_cached(data, 'summary_epic_priority', ['epics_cube'], priority_figure)
+    
+    # Machine Utilization Over Time
+    st.markdown('<div class="sub-header">Machine Utilization Overview</div>', unsafe_allow_html=True)
+    
+    # The resolution selector reruns only this chart
+    @st.fragment
+    def utilization_overview():
+        # Re-aggregate from the cube at a resolution that fits the selected date range
+        if not utilization_cube.empty:
+            resolution = st.radio("Resolution", ["Auto"] + list(TIME_RESOLUTIONS), horizontal=True,
+                                  key='utilization_resolution')
+            
+            def utilization_figure():
+                utilization_by_date, shown_resolution = utilization_over_time(utilization_cube, resolution)
+                utilization_by_date = utilization_by_date.rename(columns={'Time': 'Created On'})
+                
+                utilization_by_date['Machine_Utilization__'] = utilization_by_date['Machine_Utilization__'] * 100
+                
+                fig = make_subplots(specs=[[{"secondary_y": True}]])
+                
+                fig.add_trace(
+                    line_trace(
+                        utilization_by_date['Created On'],
+                        utilization_by_date['Machine_Utilization__'],
+                        name="Machine Utilization (%)",
+                        line=dict(color="#1e88e5", width=3)
+                    ),
+                    secondary_y=False
+                )
+                
+                fig.add_trace(
+                    count_trace(
+                        utilization_by_date['Created On'],
+                        utilization_by_date['desktop_taskstatus'],
+                        name="Number of Runs",
+                        marker_color="#90caf9"
+                    ),
+                    secondary_y=True
+                )
+                
+                fig.update_layout(
+                    title=f"Machine Utilization and Run Count Over Time (by {shown_resolution})",
+                    xaxis_title="Date",
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+                    height=400
+                )
+                
+                fig.update_yaxes(title_text="Utilization (%)", secondary_y=False)
+                fig.update_yaxes(title_text="Number of Runs", secondary_y=True)
+                
+                return fig
+            
+            plot_cached(data, 'summary_utilization_over_time', ['utilization_cube'], utilization_figure,
+                        resolution=resolution)
+    
+    utilization_overview()
+    
+    # Key Insights and Recommendations
+    st.markdown('<div class="sub-header">Key Insights & Recommendations</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="insight-box">', unsafe_allow_html=True)
+        st.markdown("<b>Key Insights:</b>", unsafe_allow_html=True)
+        st.markdown("""
+        - Streamlit Bot Monitoring Dashboard is in active development
+        - SAFE-T CLAIMS automation was completed in Week 16
+        - Machine utilization is currently at 2.03%, indicating capacity for additional workflows
+        - Maintenance activities consume approximately 3% of total time allocation
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
+        st.markdown("<b>Recommendations:</b>", unsafe_allow_html=True)
+        st.markdown("""
+        - Increase machine utilization by expanding automation workflows
+        - Complete the Streamlit Bot Monitoring Dashboard for improved visibility
+        - Evaluate potential ROI of the new test project (RPA-1179)
+        - Continue integration of Streamlit with Snowflake for enhanced reporting
+        """)
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,270 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import io
+from data_store import UTILIZATION_TABLE
+from dashboard import (EXCEL_MIME, load_data, selected_date_range, plot_cached, create_metric_card,
+                       lazy_download_button)
+from cubes import rollup_utilization, total_by
+
+# Tables and columns the page reads; a None column list reads every column
+COLUMNS = {
+    'utilization_cube': None
+}
+
+def machine_utilization_page():
+    st.markdown('<div class="main-header">LTR Data Dashboard - Machine Utilization</div>', unsafe_allow_html=True)
+    
+    data = load_data(COLUMNS)
+    if not data:
+        st.error("Failed to load data. Please check the data files.")
+        return
+    
+    utilization_cube = data['utilization_cube']
+    utilization_totals = rollup_utilization(utilization_cube).iloc[0]
+    
+    # Utilization KPIs
+    st.markdown('<div class="sub-header">Machine Utilization Key Metrics</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        avg_utilization = utilization_totals['Machine_Utilization__'] * 100
+        create_metric_card("Avg Machine Utilization", f"{avg_utilization:.1f}%", color="#1e88e5")
+    
+    with col2:
+        avg_idle = utilization_totals['Idle_Percentage__'] * 100
+        create_metric_card("Avg Idle Time", f"{avg_idle:.1f}%", color="#ff9800")
+    
+    with col3:
+        total_runtime = utilization_totals['SumRuntime_duration__mins_']
+        runtime_hours = total_runtime / 60
+        create_metric_card("Total Runtime", f"{runtime_hours:.1f}", suffix=" hours", color="#1e88e5")
+    
+    with col4:
+        if 'desktop_taskstatus' in utilization_cube.columns:
+            success_count = utilization_cube.loc[utilization_cube['desktop_taskstatus'] == 'Succeeded', 'Runs'].sum()
+            total_count = utilization_totals['Runs']
+            success_rate = (success_count / total_count) * 100 if total_count > 0 else 0
+            create_metric_card("Success Rate", f"{success_rate:.1f}%", color="#43a047")
+        else:
+            success_rate = 0
+            create_metric_card("Success Rate", "N/A", color="#43a047")
+    
+    # Success/Failure Analysis
+    st.markdown('<div class="sub-header">Success/Failure Analysis</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if 'desktop_taskstatus' in utilization_cube.columns:
+            # Success/Failure distribution
+            def run_status_figure():
+                status_counts = total_by(utilization_cube, 'desktop_taskstatus', 'Runs')
+                status_counts.columns = ['Status', 'Count']
+                
+                fig = px.pie(
+                    status_counts,
+                    names='Status',
+                    values='Count',
+                    title='Bot Run Status Distribution',
+                    color='Status',
+                    color_discrete_map={
+                        'Succeeded': '#4caf50',
+                        'Failed': '#f44336',
+                        'Cancelled': '#ff9800',
+                        'Terminated': '#9e9e9e'
+                    }
+                )
+                fig.update_layout(height=400)
+                return fig
+            
+            plot_cached(data, 'utilization_run_status', ['utilization_cube'], run_status_figure)
+        else:
+            st.warning("Task status data not available")
+    
+    with col2:
+        if 'ErrorCode' in utilization_cube.columns:
+            # Error distribution (exclude empty error codes)
+            error_df = utilization_cube[utilization_cube['ErrorCode'].notna() & (utilization_cube['ErrorCode'] != 'Unknown')]
+            if not error_df.empty:
+                def error_codes_figure():
+                    error_counts = total_by(error_df, 'ErrorCode', 'Runs')
+                    error_counts.columns = ['Error Code', 'Count']
+                    
+                    fig = px.bar(
+                        error_counts.head(10),  # Top 10 errors
+                        x='Error Code',
+                        y='Count',
+                        title='Top Error Codes',
+                        color='Count',
+                        color_continuous_scale='Reds'
+                    )
+                    fig.update_layout(height=400)
+                    return fig
+                
+                plot_cached(data, 'utilization_error_codes', ['utilization_cube'], error_codes_figure)
+            else:
+                st.info("No error codes recorded in the data")
+        else:
+            st.warning("Error code data not available")
+    
+    # Machine-specific metrics
+    st.markdown('<div class="sub-header">Machine-Specific Metrics</div>', unsafe_allow_html=True)
+    
+    if 'Flow Machine Group' in utilization_cube.columns:
+        # Group by machine
+        machine_metrics = rollup_utilization(utilization_cube, by=['Flow Machine Group'])
+        machine_metrics = machine_metrics[['Flow Machine Group', 'Machine_Utilization__',
+                                           'SumRuntime_duration__mins_', 'desktop_taskstatus']]
+        
+        # Calculate success rate per machine
+        succeeded = utilization_cube[utilization_cube['desktop_taskstatus'] == 'Succeeded']
+        machine_success = total_by(succeeded, 'Flow Machine Group', 'Runs')
+        machine_success.columns = ['Flow Machine Group', 'SuccessCount']
+        
+        machine_metrics = pd.merge(machine_metrics, machine_success, on='Flow Machine Group', how='left')
+        machine_metrics['SuccessCount'] = machine_metrics['SuccessCount'].fillna(0)
+        machine_metrics['SuccessRate'] = (machine_metrics['SuccessCount'] / machine_metrics['desktop_taskstatus']) * 100
+        
+        # Multiply utilization to get percentage
+        machine_metrics['Machine_Utilization__'] = machine_metrics['Machine_Utilization__'] * 100
+        
+        # Convert runtime to hours
+        machine_metrics['Runtime_Hours'] = machine_metrics['SumRuntime_duration__mins_'] / 60
+        
+        # Sort by utilization
+        machine_metrics = machine_metrics.sort_values('Machine_Utilization__', ascending=False)
+        
+        # Display as a bar chart
+        def machine_group_figure():
+            fig = px.bar(
+                machine_metrics,
+                x='Flow Machine Group',
+                y='Machine_Utilization__',
+                color='SuccessRate',
+                color_continuous_scale='RdYlGn',
+                title='Machine Utilization by Group',
+                hover_data=['Runtime_Hours', 'desktop_taskstatus']
+            )
+            
+            fig.update_layout(
+                yaxis_title="Utilization (%)",
+                xaxis_title="Machine Group",
+                height=500
+            )
+            
+            return fig
+        
+        plot_cached(data, 'utilization_by_machine_group', ['utilization_cube'], machine_group_figure)
+        
+        # Show detailed metrics table
+        st.markdown('<div class="sub-header">Machine Details</div>', unsafe_allow_html=True)
+        
+        # Rename columns for display
+        display_cols = {
+            'Flow Machine Group': 'Machine Group',
+            'Machine_Utilization__': 'Utilization (%)',
+            'Runtime_Hours': 'Runtime (Hours)',
+            'desktop_taskstatus': 'Total Runs',
+            'SuccessCount': 'Successful Runs',
+            'SuccessRate': 'Success Rate (%)'
+        }
+        
+        display_df = machine_metrics.rename(columns=display_cols)
+        display_df = display_df[list(display_cols.values())]
+        
+        # Format numeric columns
+        display_df['Utilization (%)'] = display_df['Utilization (%)'].round(2)
+        display_df['Runtime (Hours)'] = display_df['Runtime (Hours)'].round(2)
+        display_df['Success Rate (%)'] = display_df['Success Rate (%)'].round(2)
+        
+        st.dataframe(display_df, use_container_width=True)
+    else:
+        st.warning("Machine group data not available")
+    
+    # Utilization Trends
+    st.markdown('<div class="sub-header">Utilization Trends</div>', unsafe_allow_html=True)
+    
+    if not utilization_cube.empty:
+        # Analyze utilization by hour of day
+        def hourly_figure():
+            hourly_utilization = rollup_utilization(utilization_cube, by=['Hour'])
+            
+            hourly_utilization['Machine_Utilization__'] = hourly_utilization['Machine_Utilization__'] * 100
+            
+            fig = make_subplots(specs=[[{"secondary_y": True}]])
+            
+            fig.add_trace(
+                go.Scatter(
+                    x=hourly_utilization['Hour'],
+                    y=hourly_utilization['Machine_Utilization__'],
+                    name="Utilization (%)",
+                    line=dict(color="#1e88e5", width=3)
+                ),
+                secondary_y=False
+            )
+            
+            fig.add_trace(
+                go.Bar(
+                    x=hourly_utilization['Hour'],
+                    y=hourly_utilization['desktop_taskstatus'],
+                    name="Run Count",
+                    marker_color="#90caf9"
+                ),
+                secondary_y=True
+            )
+            
+            fig.update_layout(
+                title="Utilization and Run Count by Hour of Day",
+                xaxis_title="Hour of Day",
+                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+                height=400
+            )
+            
+            fig.update_yaxes(title_text="Utilization (%)", secondary_y=False)
+            fig.update_yaxes(title_text="Number of Runs", secondary_y=True)
+            
+            return fig
+        
+        plot_cached(data, 'utilization_by_hour', ['utilization_cube'], hourly_figure)
+    else:
+        st.warning("Time-based analysis data not available")
+    
+    # Run-level detail export, written only on request
+    st.markdown('<div class="sub-header">Run-Level Detail</div>', unsafe_allow_html=True)
+    
+    def build_run_export():
+        # openpyxl is only imported once the export is actually requested
+        from excel_export import export_table
+        excel_buffer = io.BytesIO()
+        export_table(UTILIZATION_TABLE, excel_buffer, date_range=selected_date_range(), sheet_name='Utilization_Runs')
+        return excel_buffer.getvalue()
+    
+    lazy_download_button("Run-Level Excel Export", build_run_export, "utilization_runs.xlsx", EXCEL_MIME,
+                         key="utilization_runs")
+    
+    # Utilization Insights
+    st.markdown('<div class="sub-header">Utilization Insights & Recommendations</div>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="insight-box">', unsafe_allow_html=True)
+    st.markdown("<b>Utilization Insights:</b>", unsafe_allow_html=True)
+    st.markdown("""
+    - Current machine utilization is at {:.1f}%, indicating significant available capacity
+    - Success rate is currently at {:.1f}%, exceeding the 85% goal
+    - Runtime patterns suggest optimal processing during off-hours
+    - Error patterns suggest focus areas for reliability improvements
+    """.format(avg_utilization, success_rate))
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
+    st.markdown("<b>Utilization Recommendations:</b>", unsafe_allow_html=True)
+    st.markdown("""
+    - Increase workflow volume to optimize machine utilization
+    - Implement load balancing across machine groups
+    - Schedule resource-intensive jobs during low-utilization periods
+    - Address recurring errors to improve overall success rate
+    """)
+    st.markdown('</div>', unsafe_allow_html=True)
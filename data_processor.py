@@ -1,9 +1,151 @@
 import os
+import re
+import sys
+import time
+import resource
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+from functools import lru_cache
+from date_parsing import parse_date_column
+from cubes import build_epics_cube, build_maintenance_cube, build_utilization_cube
+from data_store import (DATE_COLUMNS, EPICS_TABLE, MAINTENANCE_TABLE, UTILIZATION_TABLE,
+                        CORRELATION_TABLE, DESKTOP_FLOWS_TABLE, MACHINE_AVAILABILITY_TABLE,
+                        CLOUD_FLOWS_TABLE, SP_UOW_TABLE, COMBINE_ALL_TABLE, EPICS_CUBE_TABLE,
+                        MAINTENANCE_CUBE_TABLE, UTILIZATION_CUBE_TABLE, WEEKLY_MAINTENANCE_TABLE,
+                        WEEKLY_UTILIZATION_TABLE, WEEKLY_COMBINE_ALL_TABLE, PARTITIONED_TABLES, write_table, append_table, read_table,
+                        table_exists, read_manifest, write_manifest, file_fingerprint, read_categories,
+                        update_categories)
+
+# Export sources handled by the pipeline. Append-only sources are event logs
+# whose weekly drops overlap, so new rows are detected by the week column
+# watermark and the rows already stored at it; snapshot sources are replaced whenever their export changes.
+# Required sources feed the correlation analysis and must be present.
+# Sources with a chunksize are read that many rows at a time, so memory stays
+# bounded however large their export grows.
+SOURCES = {
+    'epics': {
+        'label': 'JIRA Epics',
+        'pattern': 'API_JIRA_Data_Epics',
+        'table': EPICS_TABLE,
+        'week_column': 'created',
+        'append_only': False,
+        'required': True
+    },
+    'maintenance': {
+        'label': 'JIRA Maintenance',
+        'pattern': 'API_JIRA_Data_Maintenance_Query',
+        'table': MAINTENANCE_TABLE,
+        'week_column': 'created',
+        'append_only': False,
+        'required': True
+    },
+    'utilization': {
+        'label': 'Machine Utilization',
+        'pattern': 'Dataverse Desktop Machine Utilizations',
+        'table': UTILIZATION_TABLE,
+        'week_column': 'Created On',
+        'append_only': True,
+        'required': True
+    },
+    'desktop_flows': {
+        'label': 'Desktop Flows',
+        'pattern': 'Dataverse_Desktop_Flows',
+        'table': DESKTOP_FLOWS_TABLE,
+        'week_column': 'Created On',
+        'append_only': True,
+        'required': False
+    },
+    'machine_availability': {
+        'label': 'Machine Availability Timeline',
+        'pattern': 'Machine Availability Timeline',
+        'table': MACHINE_AVAILABILITY_TABLE,
+        'week_column': 'Created On',
+        'append_only': True,
+        'required': False
+    },
+    'cloud_flows': {
+        'label': 'Cloud Flows',
+        'pattern': 'SQL Cloud Flows All Query',
+        'table': CLOUD_FLOWS_TABLE,
+        'week_column': 'DateTimeStarted',
+        'export_week_fields': ['WeekOfYear', 'Year - Wk'],
+        'append_only': True,
+        'required': False
+    },
+    'sp_uow': {
+        'label': 'SP Units of Work',
+        'pattern': 'SQL_SP_UOW_ALL',
+        'table': SP_UOW_TABLE,
+        'week_column': 'DateTimeStarted',
+        'export_week_fields': ['WeekOfYear'],
+        'append_only': True,
+        'required': False
+    },
+    'combine_all': {
+        'label': 'Combine All',
+        'pattern': 'Combine All',
+        'table': COMBINE_ALL_TABLE,
+        'week_column': 'DateTimeStarted',
+        'export_week_fields': ['WeekOfYear', 'YearWeekIndex', 'Year - Week', 'Year - Wk'],
+        'chunksize': 50000,
+        'append_only': True,
+        'required': False
+    }
+}
+
+# Table prefixes of the exports, e.g. "COMBINE_ALL[FlowName]". Measures have a
+# bare "[SumSuccessful]" header, which the optional prefix group also matches.
+EXPORT_PREFIXES = [
+    'API_JIRA_Data_Epics',
+    'API_JIRA_Data_Maintenance',
+    'Dataverse_Desktop Machines Utilizations',
+    'Dataverse_Desktop_Flows',
+    'Machine Availability Timeline',
+    'SQL_Cloud_Flows_All',
+    'SQL_SP_UOW_ALL',
+    'COMBINE_ALL'
+]
+EXPORT_HEADER_PATTERN = re.compile(
+    r'^(?:' + '|'.join(re.escape(prefix) for prefix in EXPORT_PREFIXES) + r')?\[([^\[\]]*)\]$'
+)
+
+# Weekly aggregates feeding the correlation analysis
+MAINTENANCE_WEEKLY_METRICS = {
+    'SumMaintenance_Hours': 'sum',
+    'Total_Maintenance_Tickets_By_Week': 'mean',
+    'Maintenance_Time_Allocation_Percentage': 'mean'
+}
+
+UTILIZATION_WEEKLY_METRICS = {
+    'SumRuntime_duration__mins_': 'sum',
+    'Machine_Utilization__': 'mean',
+    'Idle_Percentage__': 'mean',
+    'Desktop_Flow_Success_Rate_Goal': 'mean',
+    'Desktop_Run_Percent_Success': 'mean'
+}
+
+WEEKLY_AGGREGATES = {
+    'maintenance': (WEEKLY_MAINTENANCE_TABLE, MAINTENANCE_WEEKLY_METRICS),
+    'utilization': (WEEKLY_UTILIZATION_TABLE, UTILIZATION_WEEKLY_METRICS)
+}
+
+# Aggregate cubes read by the dashboard pages instead of raw rows
+CUBES = {
+    'epics': (EPICS_CUBE_TABLE, build_epics_cube),
+    'maintenance': (MAINTENANCE_CUBE_TABLE, build_maintenance_cube),
+    'utilization': (UTILIZATION_CUBE_TABLE, build_utilization_cube)
+}
+
+# String columns with at most this share of distinct values per row are
+# stored as categoricals, e.g. desktop_taskstatus, Flow Machine Group or BOT_Name
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
 
 def create_output_directory(output_dir="processed_data"):
     """
@@ -33,139 +175,193 @@ def create_output_directory(output_dir="processed_data"):
         print(f"Error creating output directory: {e}")
         return None
 
-def load_csv_files():
+def find_source_files(directory=None):
     """
-    Load the three CSV files from the current directory
+    Find the timestamped export files of every source
+    
+    Args:
+        directory (str): Directory to search; defaults to the current directory
     
     Returns:
-        tuple: Three pandas DataFrames containing the data from each CSV file
+        dict: Source key mapped to its matching file paths, oldest first
     """
-    try:
-        # Get current directory
-        current_dir = os.getcwd()
-        
-        # Define file paths
-        epics_file = None
-        maintenance_file = None
-        utilization_file = None
-        
-        # Find the files based on partial names
-        for file in os.listdir(current_dir):
-            if file.endswith(".csv"):
-                if "API_JIRA_Data_Epics" in file:
-                    epics_file = os.path.join(current_dir, file)
-                elif "API_JIRA_Data_Maintenance_Query" in file:
-                    maintenance_file = os.path.join(current_dir, file)
-                elif "Dataverse Desktop Machine Utilizations" in file:
-                    utilization_file = os.path.join(current_dir, file)
-        
-        # Check if files were found
-        if not (epics_file and maintenance_file and utilization_file):
-            missing_files = []
-            if not epics_file:
-                missing_files.append("API_JIRA_Data_Epics")
-            if not maintenance_file:
-                missing_files.append("API_JIRA_Data_Maintenance_Query")
-            if not utilization_file:
-                missing_files.append("Dataverse Desktop Machine Utilizations")
-            
-            raise FileNotFoundError(f"Could not find these files: {', '.join(missing_files)}")
-        
-        # Load CSV files
-        print(f"Loading file: {os.path.basename(epics_file)}")
-        epics_df = pd.read_csv(epics_file)
-        
-        print(f"Loading file: {os.path.basename(maintenance_file)}")
-        maintenance_df = pd.read_csv(maintenance_file)
-        
-        print(f"Loading file: {os.path.basename(utilization_file)}")
-        utilization_df = pd.read_csv(utilization_file)
-        
-        return epics_df, maintenance_df, utilization_df
+    directory = directory or os.getcwd()
+    source_files = {key: [] for key in SOURCES}
     
-    except FileNotFoundError as e:
-        print(f"File not found: {e}")
-        return None, None, None
-    except Exception as e:
-        print(f"Error loading CSV files: {e}")
-        return None, None, None
+    for file in sorted(os.listdir(directory)):
+        if file.endswith(".csv"):
+            for key, config in SOURCES.items():
+                if config['pattern'] in file:
+                    source_files[key].append(os.path.join(directory, file))
+                    break
+    
+    return source_files
 
-def clean_column_names(df):
+@lru_cache(maxsize=64)
+def _clean_header_names(columns):
     """
-    Clean column names by removing prefixes and brackets
+    Map a header signature to its cleaned column names
     
     Args:
-        df (pandas.DataFrame): DataFrame with columns to clean
+        columns (tuple): Raw column names of an export
     
     Returns:
-        pandas.DataFrame: DataFrame with cleaned column names
+        tuple: Cleaned column names in the same order
     """
-    # Create a copy of the DataFrame to avoid modifying the original
-    cleaned_df = df.copy()
+    cleaned = []
+    for col in columns:
+        match = EXPORT_HEADER_PATTERN.match(col)
+        if match:
+            cleaned.append(match.group(1))
+        elif '[' in col and ']' in col:
+            # Unknown prefix: keep the text after the last bracket
+            cleaned.append(col.split('[')[-1].replace(']', ''))
+        else:
+            cleaned.append(col)
+    return tuple(cleaned)
+
+def clean_column_names(df, inplace=False):
+    """
+    Clean column names by removing prefixes and brackets
     
-    # Clean column names
-    new_columns = {}
-    for col in cleaned_df.columns:
-        # Remove prefixes like "API_JIRA_Data_Epics[" and "]"
-        new_col = col
-        if '[' in col and ']' in col:
-            new_col = col.split('[')[-1].replace(']', '')
-        
-        # Remove "Dataverse_Desktop Machines Utilizations[" prefix
-        if 'Dataverse_Desktop Machines Utilizations[' in col:
-            new_col = col.replace('Dataverse_Desktop Machines Utilizations[', '').replace(']', '')
-            
-        # Remove "API_JIRA_Data_Maintenance[" prefix
-        if 'API_JIRA_Data_Maintenance[' in col:
-            new_col = col.replace('API_JIRA_Data_Maintenance[', '').replace(']', '')
-        
-        # Create mapping from old column name to new column name
-        new_columns[col] = new_col
+    The mapping is cached per header signature, and the columns are renamed
+    without copying the underlying data.
     
-    # Rename columns
-    cleaned_df = cleaned_df.rename(columns=new_columns)
+    Args:
+        df (pandas.DataFrame): DataFrame with columns to clean
+        inplace (bool): Rename the columns of df itself
     
-    return cleaned_df
+    Returns:
+        pandas.DataFrame: DataFrame with cleaned column names
+    """
+    new_columns = list(_clean_header_names(tuple(df.columns)))
+    if inplace:
+        df.columns = new_columns
+        return df
+    return df.set_axis(new_columns, axis=1, copy=False)
 
-def convert_date_columns(df, date_columns):
+def convert_date_columns(df, date_columns, source=None, inplace=False):
     """
     Convert date columns to proper datetime format
     
+    Each column is parsed with an explicit format detected once per source
+    column, and the Excel epoch sentinels (1899-12-30) marking empty times
+    become NaT.
+    
     Args:
         df (pandas.DataFrame): DataFrame with date columns
         date_columns (list): List of column names containing dates
+        source (str): Name of the export the columns come from, used to
+            cache the detected formats
+        inplace (bool): Convert the columns of df itself instead of a copy
     
     Returns:
         pandas.DataFrame: DataFrame with converted date columns
     """
-    df_copy = df.copy()
+    target = df if inplace else df.copy()
     
     for col in date_columns:
-        if col in df_copy.columns:
+        if col in target.columns:
             try:
                 # Convert column to datetime, handling errors
-                df_copy[col] = pd.to_datetime(df_copy[col], errors='coerce')
-                print(f"Converted column '{col}' to datetime")
+                target[col], parse_report = parse_date_column(target[col], source=source, column=col)
+                print(f"Converted column '{col}' to datetime "
+                      f"(format: {parse_report['format'] or 'inferred'}, "
+                      f"coerced: {parse_report['coerced']}, sentinels: {parse_report['sentinels']})")
             except Exception as e:
                 print(f"Error converting column '{col}' to datetime: {e}")
     
-    return df_copy
+    return target
 
-def handle_missing_values(df, strategy='median'):
+def filter_rows_since(df, column, since, inplace=False):
+    """
+    Drop rows whose date column is earlier than a watermark
+    
+    Rows at the watermark itself are kept, as a later export may add rows
+    sharing the previous export's latest timestamp, and so are rows without a
+    date, which cannot be placed against it; drop_ingested_rows removes the
+    ones already stored.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame with a datetime column
+        column (str): Name of the datetime column
+        since (pandas.Timestamp): Watermark; rows before it are dropped
+        inplace (bool): Drop the rows from df itself
+    
+    Returns:
+        pandas.DataFrame: DataFrame with the rows at or after the watermark
+    """
+    stale_rows = df.index[df[column] < since]
+    result = df.drop(index=stale_rows, inplace=inplace)
+    target = df if inplace else result
+    print(f"Kept {len(target)} rows at or after {since} or without a date")
+    return target
+
+def row_keys(df):
+    """
+    Hash each row of a raw export, identifying the same row across exports
+    
+    Args:
+        df (pandas.DataFrame): Export as read from CSV, before processing
+    
+    Returns:
+        pandas.Series: Row key of each row, as text
+    """
+    return pd.util.hash_pandas_object(df, index=False).astype(str)
+
+def count_rows(keys):
+    """Count the copies of each row, by row key"""
+    return {key: int(count) for key, count in keys.value_counts().items()}
+
+def drop_ingested_rows(df, column, since, keys, ingested_rows, inplace=False):
+    """
+    Drop the rows at the watermark or without a date that are already stored
+    
+    Rows are matched on their row key and counted, so a row repeated in an
+    export is kept as many times as it occurs beyond the stored copies. The
+    dropped copies are taken off ingested_rows, so the next chunk of the same
+    export only drops the copies left.
+    
+    Args:
+        df (pandas.DataFrame): Rows at or after the watermark
+        column (str): Name of the datetime column
+        since (pandas.Timestamp): Watermark
+        keys (pandas.Series): Row keys of the export, by row label
+        ingested_rows (dict): Row key mapped to the number of stored copies of
+            the rows at the watermark and without a date
+        inplace (bool): Drop the rows from df itself
+    
+    Returns:
+        pandas.DataFrame: DataFrame with the rows not stored yet
+    """
+    candidates = df.index[(df[column] == since) | df[column].isna()]
+    candidate_keys = keys.loc[candidates]
+    occurrence = candidate_keys.groupby(candidate_keys).cumcount()
+    stored = candidate_keys.map(ingested_rows).fillna(0)
+    stale_rows = candidates[(occurrence < stored).to_numpy()]
+    for row_key, count in count_rows(keys.loc[stale_rows]).items():
+        ingested_rows[row_key] -= count
+    result = df.drop(index=stale_rows, inplace=inplace)
+    target = df if inplace else result
+    print(f"Dropped {len(stale_rows)} rows already ingested from an earlier export")
+    return target
+
+def handle_missing_values(df, strategy='median', inplace=False):
     """
     Handle missing values in the DataFrame
     
     Args:
         df (pandas.DataFrame): DataFrame with missing values
         strategy (str): Strategy for handling missing values ('median', 'mean', or 'drop')
+        inplace (bool): Fill or drop in df itself instead of a copy
     
     Returns:
         pandas.DataFrame: DataFrame with handled missing values
     """
-    df_copy = df.copy()
+    target = df if inplace else df.copy()
     
     # Count missing values per column
-    missing_count = df_copy.isnull().sum()
+    missing_count = target.isnull().sum()
     print("\nMissing values per column:")
     for col in missing_count[missing_count > 0].index:
         print(f"  {col}: {missing_count[col]}")
@@ -173,55 +369,435 @@ def handle_missing_values(df, strategy='median'):
     # Handle missing values based on strategy
     if strategy == 'drop':
         # Drop rows with missing values
-        df_copy = df_copy.dropna()
-        print(f"Dropped rows with missing values. Remaining rows: {len(df_copy)}")
+        target.dropna(inplace=True)
+        print(f"Dropped rows with missing values. Remaining rows: {len(target)}")
     else:
+        fill_values = {}
+        
         # Fill missing numeric values with median or mean
-        numeric_cols = df_copy.select_dtypes(include=np.number).columns
+        numeric_cols = target.select_dtypes(include=np.number).columns
         for col in numeric_cols:
-            if df_copy[col].isnull().sum() > 0:
+            if missing_count[col] > 0:
                 if strategy == 'median':
-                    df_copy[col] = df_copy[col].fillna(df_copy[col].median())
+                    fill_values[col] = target[col].median()
                     print(f"  Filled '{col}' missing values with median")
                 elif strategy == 'mean':
-                    df_copy[col] = df_copy[col].fillna(df_copy[col].mean())
+                    fill_values[col] = target[col].mean()
                     print(f"  Filled '{col}' missing values with mean")
         
         # Fill missing categorical values with most frequent value or 'Unknown'
-        categorical_cols = df_copy.select_dtypes(include=['object']).columns
+        categorical_cols = target.select_dtypes(include=['object']).columns
         for col in categorical_cols:
-            if df_copy[col].isnull().sum() > 0:
-                df_copy[col] = df_copy[col].fillna('Unknown')
+            if missing_count[col] > 0:
+                fill_values[col] = 'Unknown'
                 print(f"  Filled '{col}' missing values with 'Unknown'")
+        
+        if fill_values:
+            target.fillna(value=fill_values, inplace=True)
+    
+    return target
+
+@lru_cache(maxsize=8)
+def build_week_calendar(first_year, last_year):
+    """
+    Build a date to week lookup calendar covering whole years
+    
+    The exports number weeks their own way: weeks start on Sunday and week 1
+    is the one holding January 1st, as Excel's WEEKNUM. Those weeks are kept
+    next to the ISO ones so a Sunday keeps the export's week.
     
-    return df_copy
+    Args:
+        first_year (int): First calendar year covered
+        last_year (int): Last calendar year covered
+    
+    Returns:
+        pandas.DataFrame: One row per day with the ISO Year and Week, the
+        integer YearWeek key (e.g. 202516) and its 'Year - Week' label, and
+        the same export fields as ExportWeek, ExportYearWeek and
+        'Export Year - Week'
+    """
+    dates = pd.date_range(f"{first_year}-01-01", f"{last_year}-12-31", freq='D')
+    iso = dates.isocalendar()
+    calendar = pd.DataFrame({
+        'Date': dates,
+        'Year': iso['year'].to_numpy(dtype='uint32'),
+        'Week': iso['week'].to_numpy(dtype='uint32')
+    })
+    calendar['YearWeek'] = calendar['Year'] * 100 + calendar['Week']
+    
+    # Sunday-start weeks counted from the week holding January 1st
+    years = dates.year.to_numpy(dtype='uint32')
+    days_into_year = dates.dayofyear.to_numpy() - 1
+    jan_first_weekday = (dates.dayofweek.to_numpy() + 1 - days_into_year) % 7  # Sunday is 0
+    calendar['ExportWeek'] = ((days_into_year + jan_first_weekday) // 7 + 1).astype('uint32')
+    calendar['ExportYearWeek'] = years * 100 + calendar['ExportWeek'].to_numpy()
+    
+    # Labels are built once per distinct week and shared through a categorical
+    for key_field, label_field in [('YearWeek', 'Year - Week'), ('ExportYearWeek', 'Export Year - Week')]:
+        week_keys, week_codes = np.unique(calendar[key_field].to_numpy(), return_inverse=True)
+        week_labels = [f"{key // 100}-{key % 100:02d}" for key in week_keys]
+        calendar[label_field] = pd.Categorical.from_codes(week_codes, categories=week_labels)
+    return calendar
 
-def create_week_column(df, date_column):
+def lookup_week_fields(dates, fields=('Year', 'Week', 'YearWeek')):
+    """
+    Look up week fields for a datetime Series in the cached week calendar
+    
+    Args:
+        dates (pandas.Series): Datetime values; NaT gives missing fields
+        fields (iterable): Calendar columns to return
+    
+    Returns:
+        pandas.DataFrame: Requested fields aligned with the index of dates
+    """
+    valid = dates.notna().to_numpy()
+    fields = list(fields)
+    if not valid.any():
+        return pd.DataFrame({field: pd.Series(pd.NA, index=dates.index, dtype='object') for field in fields})
+    
+    days = dates.to_numpy(dtype='datetime64[D]')
+    first_year = dates.min().year
+    calendar = build_week_calendar(first_year, dates.max().year)
+    offsets = (days - np.datetime64(f"{first_year}-01-01", 'D')).astype('int64')
+    offsets[~valid] = 0
+    
+    looked_up = {}
+    for field in fields:
+        column = calendar[field]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes = column.cat.codes.to_numpy()[offsets]
+            codes[~valid] = -1
+            looked_up[field] = pd.Categorical.from_codes(codes, dtype=column.dtype)
+        else:
+            looked_up[field] = pd.arrays.IntegerArray(column.to_numpy()[offsets], ~valid)
+    return pd.DataFrame(looked_up, index=dates.index)
+
+# Week fields carried by the exports, mapped to the calendar column serving
+# them; they number Sunday-start weeks, not ISO weeks
+EXPORT_WEEK_FIELDS = {
+    'WeekOfYear': 'ExportWeek',
+    'YearWeekIndex': 'ExportYearWeek',
+    'Year - Week': 'Export Year - Week',
+    'Year - Wk': 'Export Year - Week'
+}
+
+def create_week_column(df, date_column, inplace=False, export_fields=None):
     """
     Create a week column based on a date column
     
+    Year, Week and the integer YearWeek key (e.g. 202516) are looked up in a
+    cached ISO week calendar instead of being derived row by row.
+    
     Args:
         df (pandas.DataFrame): DataFrame with a date column
         date_column (str): Name of the date column
+        inplace (bool): Add the columns to df itself instead of a copy
+        export_fields (list): Optional export week fields to rebuild from the
+            calendar, e.g. 'WeekOfYear', 'YearWeekIndex' or 'Year - Week'.
+            They keep the export's Sunday-start weeks, and rows the export
+            left empty stay empty.
     
     Returns:
         pandas.DataFrame: DataFrame with an added week column
     """
-    df_copy = df.copy()
+    target = df if inplace else df.copy()
     
-    if date_column in df_copy.columns:
-        if pd.api.types.is_datetime64_dtype(df_copy[date_column]):
-            # Extract year and week from the date column
-            df_copy['Year'] = df_copy[date_column].dt.isocalendar().year
-            df_copy['Week'] = df_copy[date_column].dt.isocalendar().week
-            df_copy['YearWeek'] = df_copy['Year'].astype(str) + df_copy['Week'].astype(str).str.zfill(2)
+    if date_column in target.columns:
+        if pd.api.types.is_datetime64_dtype(target[date_column]):
+            export_fields = list(export_fields or [])
+            fields = ['Year', 'Week', 'YearWeek'] + [EXPORT_WEEK_FIELDS[field] for field in export_fields]
+            week_fields = lookup_week_fields(target[date_column], fields=dict.fromkeys(fields))
+            
+            for field in ['Year', 'Week', 'YearWeek']:
+                target[field] = week_fields[field]
+            for field in export_fields:
+                if field in target.columns:
+                    target[field] = week_fields[EXPORT_WEEK_FIELDS[field]].where(target[field].notna())
             print(f"Created week columns based on '{date_column}'")
         else:
             print(f"Column '{date_column}' is not in datetime format")
     else:
         print(f"Column '{date_column}' not found in DataFrame")
     
-    return df_copy
+    return target
+
+def intern_categories(df, inplace=False, categories=None):
+    """
+    Convert low-cardinality string columns to categoricals
+    
+    Columns already in the shared dictionaries of the store keep the codes of
+    known values, with unseen values appended.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame with string columns
+        inplace (bool): Convert the columns of df itself instead of a copy
+        categories (dict): Shared category dictionaries of the store
+    
+    Returns:
+        pandas.DataFrame: DataFrame with categorical columns
+    """
+    target = df if inplace else df.copy()
+    categories = categories or {}
+    
+    interned = []
+    for col in target.select_dtypes(include=['object']).columns:
+        values = target[col]
+        if pd.api.types.infer_dtype(values, skipna=True) != 'string':
+            continue
+        unique = values.dropna().unique()
+        if len(unique) > CATEGORY_MAX_UNIQUE_RATIO * len(values):
+            continue
+        
+        known = categories.get(col, [])
+        known_set = set(known)
+        target[col] = values.astype(pd.CategoricalDtype(known + sorted(v for v in unique if v not in known_set)))
+        interned.append(col)
+    
+    if interned:
+        print(f"Stored {len(interned)} string columns as categoricals: {', '.join(interned)}")
+    return target
+
+def shares_categories(unique_count, rows, partitions=1):
+    """
+    Check whether a categorical column is worth a dictionary shared by the files of its table
+    
+    Tables are read a partition at a time, so a column is shared only when it
+    is low-cardinality within one partition, by the same ratio that decides
+    which columns become categoricals. Identifier columns such as FlowGUID
+    or the flow URLs then keep the dictionary stored in each file.
+    
+    Args:
+        unique_count (int): Distinct values of the column
+        rows (int): Rows of the table
+        partitions (int): Partitions the rows are stored in
+    
+    Returns:
+        bool: True if the column's categories should be shared
+    """
+    return unique_count <= CATEGORY_MAX_UNIQUE_RATIO * rows / max(partitions, 1)
+
+def table_partition_count(df, name):
+    """Number of YearWeek partitions the rows of a table are stored in"""
+    if name not in PARTITIONED_TABLES or 'YearWeek' not in df.columns:
+        return 1
+    return df['YearWeek'].nunique(dropna=False)
+
+def table_categories(table, name):
+    """
+    Collect the categories of the low-cardinality dictionary-encoded columns of a table
+    
+    Args:
+        table (pyarrow.Table): Processed table
+        name (str): Table name
+    
+    Returns:
+        dict: Column name mapped to its list of categories
+    """
+    partitions = 1
+    if name in PARTITIONED_TABLES and 'YearWeek' in table.column_names:
+        partitions = pc.count_distinct(table.column('YearWeek'), mode='all').as_py()
+    
+    categories = {}
+    for field in table.schema:
+        if pa.types.is_dictionary(field.type):
+            unique_count = pc.count_distinct(table.column(field.name).cast(field.type.value_type)).as_py()
+            if not shares_categories(unique_count, len(table), partitions):
+                continue
+            values = {}
+            for chunk in table.column(field.name).chunks:
+                values.update(dict.fromkeys(chunk.dictionary.to_pylist()))
+            categories[field.name] = list(values)
+    return categories
+
+def reset_peak_memory():
+    """
+    Reset the peak resident memory counter of this process, where supported
+    
+    Returns:
+        bool: True if the counter was reset (Linux only)
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def peak_memory_mb():
+    """
+    Peak resident memory of this process since the last reset
+    
+    Returns:
+        float: Peak resident set size in MB
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Without /proc the best available figure is the lifetime peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_processing_chain(df, steps, label=None):
+    """
+    Apply processing steps to a DataFrame in place and report memory per stage
+    
+    Every step works on the same DataFrame object, so a source is never
+    copied between stages.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to process; it is modified in place
+        steps (list): (name, function, kwargs) tuples. Each function takes
+            the DataFrame first and accepts inplace=True.
+        label (str): Name of the data printed with the stage report
+    
+    Returns:
+        tuple: Processed DataFrame and a list of per-stage reports with the
+        peak resident memory in MB and the elapsed seconds
+    """
+    stage_reports = []
+    for name, func, kwargs in steps:
+        reset_peak_memory()
+        start = time.perf_counter()
+        df = func(df, inplace=True, **kwargs)
+        stage_reports.append({
+            'stage': name,
+            'peak_rss_mb': peak_memory_mb(),
+            'seconds': time.perf_counter() - start
+        })
+    
+    print(f"\nStage report{f' for {label}' if label else ''}:")
+    for report in stage_reports:
+        print(f"  {report['stage']}: peak RSS {report['peak_rss_mb']:.1f} MB, {report['seconds']:.2f}s")
+    
+    return df, stage_reports
+
+def process_source(df, key, since=None, categories=None, keys=None, ingested_rows=None):
+    """
+    Clean, type and enrich a raw export of one source
+    
+    Args:
+        df (pandas.DataFrame): Raw export as read from CSV; it is modified in place
+        key (str): Source key in SOURCES
+        since (pandas.Timestamp): Optional watermark; only rows whose week
+            column is at or after it, or empty, are kept
+        categories (dict): Shared category dictionaries of the store
+        keys (pandas.Series): Row keys of df, see row_keys; required with since
+        ingested_rows (dict): Row key mapped to its stored copies, of the rows
+            at the watermark and without a date; see record_ingest
+    
+    Returns:
+        pandas.DataFrame: Processed DataFrame
+    """
+    config = SOURCES[key]
+    
+    steps = [
+        ('clean_column_names', clean_column_names, {}),
+        ('convert_date_columns', convert_date_columns, {'date_columns': DATE_COLUMNS[config['table']], 'source': key})
+    ]
+    if since is not None:
+        steps.append(('filter_rows_since', filter_rows_since, {'column': config['week_column'], 'since': since}))
+        steps.append(('drop_ingested_rows', drop_ingested_rows, {'column': config['week_column'], 'since': since,
+                                                                 'keys': keys, 'ingested_rows': ingested_rows or {}}))
+    steps.extend([
+        ('handle_missing_values', handle_missing_values, {}),
+        ('create_week_column', create_week_column, {'date_column': config['week_column'],
+                                                    'export_fields': config.get('export_week_fields')}),
+        ('intern_categories', intern_categories, {'categories': categories})
+    ])
+    
+    df, _ = run_processing_chain(df, steps, label=config['label'])
+    return df
+
+def aggregate_weekly(df, metrics, weeks=None):
+    """
+    Aggregate metrics per YearWeek
+    
+    Args:
+        df (pandas.DataFrame): DataFrame with a YearWeek column
+        metrics (dict): Column to aggregation function mapping
+        weeks (iterable): Optional subset of YearWeek values to aggregate
+    
+    Returns:
+        pandas.DataFrame: One row per YearWeek
+    """
+    if weeks is not None:
+        df = df[df['YearWeek'].isin(weeks)]
+    return df.groupby('YearWeek').agg(metrics).reset_index()
+
+# Combine All totals per week, bot and project. They are sums, so they are
+# folded chunk by chunk and the totals of new rows add to the stored ones.
+COMBINE_ALL_GROUP_COLUMNS = ['YearWeek', 'BOT_Name', 'JobLog.Automation Project Name']
+COMBINE_ALL_SUM_COLUMNS = ['Hours Saved', 'Total Impact', 'Successful', 'Failed']
+
+def aggregate_combine_all(df):
+    """
+    Sum Combine All rows per week, bot and project
+    
+    Args:
+        df (pandas.DataFrame): Cleaned Combine All rows with a YearWeek
+            column, before their missing values are filled
+    
+    Returns:
+        pandas.DataFrame: Partial sums indexed by COMBINE_ALL_GROUP_COLUMNS, plus a Runs count
+    """
+    groups = [df['YearWeek']]
+    # Missing bot or project names are grouped as 'Unknown'
+    for col in COMBINE_ALL_GROUP_COLUMNS[1:]:
+        groups.append(df[col].astype(object).fillna('Unknown'))
+    return df[COMBINE_ALL_SUM_COLUMNS].assign(Runs=1).groupby(groups, dropna=False).sum()
+
+def add_totals(totals, partial):
+    """Fold partial sums into running totals; None totals start from the partial sums"""
+    if partial is None:
+        return totals
+    return partial if totals is None else totals.add(partial, fill_value=0)
+
+def totals_table(totals, columns):
+    """
+    Turn running totals into a table
+    
+    Args:
+        totals (pandas.DataFrame): Sums indexed by their group columns, or None
+        columns (list): Columns of the table, for an empty one
+    
+    Returns:
+        pandas.DataFrame: One row per group, with an integer Runs count
+    """
+    if totals is None:
+        return pd.DataFrame(columns=columns)
+    table_df = totals.reset_index()
+    table_df['Runs'] = table_df['Runs'].astype('int64')
+    return table_df
+
+# Weekly totals of chunked sources: table, aggregation and the columns it reads
+WEEKLY_TOTALS = {
+    'combine_all': (WEEKLY_COMBINE_ALL_TABLE, aggregate_combine_all,
+                    COMBINE_ALL_GROUP_COLUMNS + COMBINE_ALL_SUM_COLUMNS)
+}
+
+def correlate_weekly(maintenance_weekly, utilization_weekly):
+    """
+    Join weekly maintenance and utilization aggregates and correlate them
+    
+    Args:
+        maintenance_weekly (pandas.DataFrame): Weekly maintenance metrics
+        utilization_weekly (pandas.DataFrame): Weekly utilization metrics
+    
+    Returns:
+        tuple: Correlation DataFrame and correlation matrix
+    """
+    # Merge DataFrames on YearWeek
+    correlation_df = pd.merge(maintenance_weekly, utilization_weekly, on='YearWeek', how='inner')
+    
+    # Calculate correlation matrix
+    numeric_cols = correlation_df.select_dtypes(include=np.number).columns
+    correlation_matrix = correlation_df[numeric_cols].corr()
+    
+    return correlation_df, correlation_matrix
 
 def calculate_correlation_metrics(maintenance_df, utilization_df):
     """
@@ -238,29 +814,13 @@ def calculate_correlation_metrics(maintenance_df, utilization_df):
         # Ensure we have YearWeek columns in both DataFrames
         if 'YearWeek' not in maintenance_df.columns or 'YearWeek' not in utilization_df.columns:
             print("YearWeek column missing in one or both DataFrames")
-            return None
+            return None, None
         
         # Group by YearWeek and calculate metrics
-        maintenance_weekly = maintenance_df.groupby('YearWeek').agg({
-            'SumMaintenance_Hours': 'sum',
-            'Total_Maintenance_Tickets_By_Week': 'mean',
-            'Maintenance_Time_Allocation_Percentage': 'mean'
-        }).reset_index()
-        
-        utilization_weekly = utilization_df.groupby('YearWeek').agg({
-            'SumRuntime_duration__mins_': 'sum',
-            'Machine_Utilization__': 'mean',
-            'Idle_Percentage__': 'mean',
-            'Desktop_Flow_Success_Rate_Goal': 'mean',
-            'Desktop_Run_Percent_Success': 'mean'
-        }).reset_index()
-        
-        # Merge DataFrames on YearWeek
-        correlation_df = pd.merge(maintenance_weekly, utilization_weekly, on='YearWeek', how='inner')
+        maintenance_weekly = aggregate_weekly(maintenance_df, MAINTENANCE_WEEKLY_METRICS)
+        utilization_weekly = aggregate_weekly(utilization_df, UTILIZATION_WEEKLY_METRICS)
         
-        # Calculate correlation matrix
-        numeric_cols = correlation_df.select_dtypes(include=np.number).columns
-        correlation_matrix = correlation_df[numeric_cols].corr()
+        correlation_df, correlation_matrix = correlate_weekly(maintenance_weekly, utilization_weekly)
         
         print("\nCorrelation Analysis Complete")
         return correlation_df, correlation_matrix
@@ -294,69 +854,487 @@ def plot_correlation_matrix(correlation_matrix, output_path):
     except Exception as e:
         print(f"Error plotting correlation matrix: {e}")
 
-def main():
+def record_ingest(manifest, key, path, fingerprint, df, keys=None, rows=None):
     """
-    Main function to process the data
+    Record an ingested export file in the manifest and advance the source watermark
+    
+    The rows stored at the watermark and without a date are counted by row
+    key, so a later export repeating them is not appended twice.
+    
+    Args:
+        manifest (dict): Ingest manifest keyed by source
+        key (str): Source key in SOURCES
+        path (str): Path of the ingested export file
+        fingerprint (dict): Size, mtime and content hash of the file
+        df (pandas.DataFrame): Rows ingested from the file
+        keys (array-like): Row keys of the ingested rows, in the order of df;
+            None records no row counts
+        rows (int): Rows ingested from the file when df holds only those at
+            its latest date and without one; defaults to the rows of df
     """
-    print("Starting data processing...")
+    entry = manifest.setdefault(key, {'watermark': None, 'files': {}})
+    week_column = SOURCES[key]['week_column']
+    max_date = df[week_column].max() if week_column in df.columns and len(df) > 0 else None
+    if pd.isna(max_date):
+        max_date = None
     
-    # Create output directory
-    output_path = create_output_directory("processed_data")
-    if not output_path:
+    entry['files'][os.path.basename(path)] = dict(
+        fingerprint,
+        rows_ingested=len(df) if rows is None else rows,
+        max_date=max_date.isoformat() if max_date is not None else None
+    )
+    if max_date is not None and (entry['watermark'] is None or max_date > pd.Timestamp(entry['watermark'])):
+        entry['watermark'] = max_date.isoformat()
+        # Rows stored at the previous watermark are now all before it
+        entry['watermark_rows'] = {}
+    if keys is None or week_column not in df.columns:
         return
     
-    # Load CSV files
-    epics_df, maintenance_df, utilization_df = load_csv_files()
-    if epics_df is None or maintenance_df is None or utilization_df is None:
+    keys = pd.Series(np.asarray(keys), index=df.index)
+    watermark_rows = entry.get('watermark_rows', {})
+    if entry['watermark'] is not None:
+        at_watermark = keys[(df[week_column] == pd.Timestamp(entry['watermark'])).to_numpy()]
+        for row_key, count in count_rows(at_watermark).items():
+            watermark_rows[row_key] = watermark_rows.get(row_key, 0) + count
+    entry['watermark_rows'] = watermark_rows
+    
+    undated_rows = entry.get('undated_rows', {})
+    for row_key, count in count_rows(keys[df[week_column].isna().to_numpy()]).items():
+        undated_rows[row_key] = undated_rows.get(row_key, 0) + count
+    entry['undated_rows'] = undated_rows
+
+def export_correlation(correlation_df, correlation_matrix, output_path):
+    """
+    Plot the correlation matrix and export the correlation table
+    
+    Args:
+        correlation_df (pandas.DataFrame): Weekly correlation data
+        correlation_matrix (pandas.DataFrame): Correlation matrix
+        output_path (str): Path of the processed data store
+    """
+    plot_correlation_matrix(correlation_matrix, output_path)
+    path = write_table(correlation_df, CORRELATION_TABLE, output_path)
+    print(f"Exported correlation data to: {path}")
+
+def run_in_pool(func, tasks, workers=1):
+    """
+    Run a function over argument tuples, in worker processes when workers > 1
+    
+    Args:
+        func (callable): Top-level function to run; must be picklable
+        tasks (list): Argument tuples, one per call
+        workers (int): Number of worker processes; 1 runs in this process
+    
+    Returns:
+        list: Results in completion order
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [func(*args) for args in tasks]
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        futures = [executor.submit(func, *args) for args in tasks]
+        return [future.result() for future in as_completed(futures)]
+
+def ingest_chunks(key, path, output_path, categories, replace=True, since=None, ingested_rows=None):
+    """
+    Process and store the export of a chunked source one chunk at a time
+    
+    Each chunk is processed, stored and folded into the weekly totals on its
+    own, so memory is bounded by the chunk size and the YearWeek partitions a
+    chunk falls in rather than by the size of the export. Missing values are
+    filled from the statistics of their chunk; the weekly totals sum the
+    export's own values.
+    
+    Args:
+        key (str): Source key in SOURCES, with a chunksize
+        path (str): Path of the export file
+        output_path (str): Path of the processed data store
+        categories (dict): Shared category dictionaries of the store
+        replace (bool): Replace the stored table, rather than append to it
+        since (pandas.Timestamp): Optional watermark, see process_source
+        ingested_rows (dict): Stored copies of the rows at the watermark and
+            without a date, see process_source
+    
+    Returns:
+        tuple: (rows ingested, written table path or None, DataFrame of the
+        week column and row_key of the ingested rows at their latest date or
+        without one, categories of the ingested rows, weekly totals of the
+        ingested rows or None, set of touched YearWeek values)
+    """
+    config = SOURCES[key]
+    week_column = config['week_column']
+    aggregate, totals_columns = WEEKLY_TOTALS[key][1:] if key in WEEKLY_TOTALS else (None, [])
+    categories = dict(categories)
+    totals = None
+    rows = 0
+    table_file = None
+    latest_rows = pd.DataFrame({week_column: pd.Series(dtype='datetime64[ns]'), 'row_key': pd.Series(dtype=object)})
+    touched_weeks = set()
+    
+    for chunk in pd.read_csv(path, chunksize=config['chunksize']):
+        keys = row_keys(chunk)
+        # Kept before processing fills the missing values
+        cleaned = _clean_header_names(tuple(chunk.columns))
+        totals_df = clean_column_names(chunk[[raw for raw, clean in zip(chunk.columns, cleaned)
+                                              if clean in totals_columns]])
+        df = process_source(chunk, key, since=since, categories=categories, keys=keys, ingested_rows=ingested_rows)
+        if df.empty:
+            continue
+        if replace and rows == 0:
+            table_file = write_table(df, config['table'], output_path)
+        else:
+            table_file = append_table(df, config['table'], output_path)
+        rows += len(df)
+        touched_weeks.update(df['YearWeek'].dropna().unique())
+        if aggregate is not None:
+            totals = add_totals(totals, aggregate(totals_df.loc[df.index].assign(YearWeek=df['YearWeek'])))
+        
+        # Later chunks keep the codes of the values seen so far
+        partitions = table_partition_count(df, config['table'])
+        for col in df.select_dtypes(include=['category']).columns:
+            if col in categories or shares_categories(df[col].nunique(), len(df), partitions):
+                categories[col] = list(dict.fromkeys([*categories.get(col, []), *df[col].cat.categories]))
+        
+        # The manifest needs only the rows at the latest date and without one
+        chunk_rows = df[[week_column]].assign(row_key=keys.loc[df.index].to_numpy())
+        latest_rows = pd.concat([latest_rows, chunk_rows], ignore_index=True) if len(latest_rows) else chunk_rows
+        latest_date = latest_rows[week_column].max()
+        latest_rows = latest_rows[(latest_rows[week_column] == latest_date) | latest_rows[week_column].isna()]
+    
+    print(f"Ingested {rows} {config['label']} rows in chunks of {config['chunksize']}")
+    return rows, table_file, latest_rows, categories, totals, touched_weeks
+
+def ingest_source(key, path, output_path):
+    """
+    Load, process and store the export of one source
+    
+    Runs in a worker process in parallel mode, so it writes its own tables
+    and records the file in a manifest entry of its own. Only the processed
+    data of the required sources is sent back, as an Arrow table.
+    
+    Args:
+        key (str): Source key in SOURCES
+        path (str): Path of the export file
+        output_path (str): Path of the processed data store
+    
+    Returns:
+        tuple: (key, pyarrow.Table of the processed data or None for chunked
+        sources, written table paths, manifest entry, shared categories)
+    """
+    config = SOURCES[key]
+    print(f"\nProcessing {config['label']} data from: {os.path.basename(path)}")
+    manifest = {}
+    _, fingerprint = file_fingerprint(path)
+    categories = read_categories(config['table'], output_path)
+    
+    if config.get('chunksize'):
+        rows, table_file, latest_rows, categories, totals, _ = ingest_chunks(key, path, output_path, categories)
+        record_ingest(manifest, key, path, fingerprint, latest_rows[[config['week_column']]],
+                      latest_rows['row_key'], rows=rows)
+        table_files = [table_file] if table_file else []
+        if key in WEEKLY_TOTALS:
+            weekly_table, _, columns = WEEKLY_TOTALS[key]
+            table_files.append(write_table(totals_table(totals, columns + ['Runs']), weekly_table, output_path))
+        return key, None, table_files, manifest[key], categories
+    
+    raw_df = pd.read_csv(path)
+    keys = row_keys(raw_df)
+    df = process_source(raw_df, key, categories=categories)
+    table_file = write_table(df, config['table'], output_path)
+    record_ingest(manifest, key, path, fingerprint, df, keys.loc[df.index])
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    categories = table_categories(table, config['table'])
+    return key, table if config['required'] else None, [table_file], manifest[key], categories
+
+def run_full_pipeline(output_path, workers=1):
+    """
+    Rebuild the processed store from the latest export of every source
+    
+    Args:
+        output_path (str): Path of the processed data store
+        workers (int): Number of worker processes ingesting sources in parallel
+    """
+    source_files = find_source_files()
+    missing_files = [config['pattern'] for key, config in SOURCES.items()
+                     if config['required'] and not source_files[key]]
+    if missing_files:
+        print(f"File not found: Could not find these files: {', '.join(missing_files)}")
         return
     
-    print("\nProcessing JIRA Epics data...")
-    # Clean JIRA Epics data
-    epics_df = clean_column_names(epics_df)
-    epics_date_columns = ['created', 'updated', 'duedate', 'Completed Date', 'Start Date']
-    epics_df = convert_date_columns(epics_df, epics_date_columns)
-    epics_df = handle_missing_values(epics_df)
-    epics_df = create_week_column(epics_df, 'created')
-    
-    print("\nProcessing JIRA Maintenance data...")
-    # Clean JIRA Maintenance data
-    maintenance_df = clean_column_names(maintenance_df)
-    maintenance_date_columns = ['created', 'updated', 'duedate', 'Updated Completed Date', 'Start Date', 'Completed Date']
-    maintenance_df = convert_date_columns(maintenance_df, maintenance_date_columns)
-    maintenance_df = handle_missing_values(maintenance_df)
-    maintenance_df = create_week_column(maintenance_df, 'created')
-    
-    print("\nProcessing Machine Utilization data...")
-    # Clean Machine Utilization data
-    utilization_df = clean_column_names(utilization_df)
-    utilization_date_columns = ['Created On', 'Start', 'End', 'Date', 'Start UTC', 'End UTC']
-    utilization_df = convert_date_columns(utilization_df, utilization_date_columns)
-    utilization_df = handle_missing_values(utilization_df)
-    utilization_df = create_week_column(utilization_df, 'Created On')
+    latest_files = {key: files[-1] for key, files in source_files.items() if files}
+    try:
+        results = run_in_pool(ingest_source, [(key, path, output_path) for key, path in latest_files.items()], workers)
+    except Exception as e:
+        print(f"Error processing source files: {e}")
+        return
+    
+    tables = {key: table for key, table, _, _, _ in results}
+    manifest = {key: entry for key, _, _, entry, _ in results}
+    print("\nExported processed data to:")
+    for _, _, table_files, _, _ in results:
+        for table_file in table_files:
+            print(f"  {table_file}")
+    
+    for key, _, _, _, categories in results:
+        update_categories(categories, SOURCES[key]['table'], output_path)
+    
+    epics_df = tables['epics'].to_pandas()
+    maintenance_df = tables['maintenance'].to_pandas()
+    utilization_df = tables['utilization'].to_pandas()
     
     print("\nCalculating correlation metrics...")
     # Calculate correlation metrics
     correlation_df, correlation_matrix = calculate_correlation_metrics(maintenance_df, utilization_df)
     
     if correlation_df is not None and correlation_matrix is not None:
-        # Plot correlation matrix
-        plot_correlation_matrix(correlation_matrix, output_path)
-        
-        # Export processed data
         try:
-            epics_df.to_csv(os.path.join(output_path, 'processed_epics.csv'), index=False)
-            maintenance_df.to_csv(os.path.join(output_path, 'processed_maintenance.csv'), index=False)
-            utilization_df.to_csv(os.path.join(output_path, 'processed_utilization.csv'), index=False)
-            correlation_df.to_csv(os.path.join(output_path, 'correlation_data.csv'), index=False)
+            write_table(aggregate_weekly(maintenance_df, MAINTENANCE_WEEKLY_METRICS), WEEKLY_MAINTENANCE_TABLE, output_path)
+            write_table(aggregate_weekly(utilization_df, UTILIZATION_WEEKLY_METRICS), WEEKLY_UTILIZATION_TABLE, output_path)
+            for key, df in (('epics', epics_df), ('maintenance', maintenance_df), ('utilization', utilization_df)):
+                cube_table, build_cube = CUBES[key]
+                write_table(build_cube(df), cube_table, output_path)
+            export_correlation(correlation_df, correlation_matrix, output_path)
             
-            print("\nExported processed data to:")
-            print(f"  {os.path.join(output_path, 'processed_epics.csv')}")
-            print(f"  {os.path.join(output_path, 'processed_maintenance.csv')}")
-            print(f"  {os.path.join(output_path, 'processed_utilization.csv')}")
-            print(f"  {os.path.join(output_path, 'correlation_data.csv')}")
+            # Record the ingested exports so later runs can be incremental
+            write_manifest(manifest, output_path)
         
         except Exception as e:
             print(f"Error exporting processed data: {e}")
 
+def ingest_source_incremental(key, paths, entry, output_path):
+    """
+    Ingest the export files of one source not yet recorded in its manifest entry
+    
+    Args:
+        key (str): Source key in SOURCES
+        paths (list): Export files of the source, oldest first
+        entry (dict): Manifest entry of the source
+        output_path (str): Path of the processed data store
+    
+    Returns:
+        tuple: (key, updated manifest entry, set of touched YearWeek values,
+        True if the table was replaced, categories of the ingested rows,
+        weekly totals of the ingested rows of a WEEKLY_TOTALS source or None)
+    """
+    config = SOURCES[key]
+    manifest = {key: entry}
+    touched_weeks = set()
+    replaced = False
+    shared_categories = read_categories(config['table'], output_path)
+    categories = {}
+    totals = None
+    
+    if not config['append_only']:
+        paths = paths[-1:]
+    
+    for path in paths:
+        name = os.path.basename(path)
+        changed, fingerprint = file_fingerprint(path, entry['files'].get(name))
+        if not changed:
+            entry['files'][name].update(fingerprint)
+            print(f"Skipping already ingested file: {name}")
+            continue
+        
+        print(f"\nIngesting {config['label']} file: {name}")
+        if config.get('chunksize'):
+            append = config['append_only'] and table_exists(config['table'], output_path)
+            since = pd.Timestamp(entry['watermark']) if append and entry['watermark'] else None
+            ingested_rows = {**entry.get('watermark_rows', {}), **entry.get('undated_rows', {})}
+            rows, _, latest_rows, file_categories, file_totals, weeks = ingest_chunks(
+                key, path, output_path, shared_categories, replace=not append, since=since,
+                ingested_rows=ingested_rows if append else None
+            )
+            record_ingest(manifest, key, path, fingerprint, latest_rows[[config['week_column']]],
+                          latest_rows['row_key'], rows=rows)
+            for col, values in file_categories.items():
+                categories.setdefault(col, []).extend(values)
+            if append:
+                touched_weeks.update(weeks)
+                totals = add_totals(totals, file_totals)
+            else:
+                replaced = True
+                touched_weeks = set(weeks)
+                totals = file_totals
+            continue
+        
+        raw_df = pd.read_csv(path)
+        keys = row_keys(raw_df)
+        if config['append_only'] and table_exists(config['table'], output_path):
+            since = pd.Timestamp(entry['watermark']) if entry['watermark'] else None
+            ingested_rows = {**entry.get('watermark_rows', {}), **entry.get('undated_rows', {})}
+            new_df = process_source(raw_df, key, since=since, categories=shared_categories, keys=keys,
+                                    ingested_rows=ingested_rows)
+            if not new_df.empty:
+                append_table(new_df, config['table'], output_path)
+                touched_weeks.update(new_df['YearWeek'].dropna().unique())
+        else:
+            new_df = process_source(raw_df, key, categories=shared_categories)
+            write_table(new_df, config['table'], output_path)
+            replaced = True
+        
+        record_ingest(manifest, key, path, fingerprint, new_df, keys.loc[new_df.index])
+        # Columns already shared keep growing; others are shared once low-cardinality
+        partitions = table_partition_count(new_df, config['table'])
+        for col in new_df.select_dtypes(include=['category']).columns:
+            if col in shared_categories or shares_categories(new_df[col].nunique(), len(new_df), partitions):
+                categories.setdefault(col, []).extend(new_df[col].cat.categories)
+    
+    return key, manifest[key], touched_weeks, replaced, categories, totals
+
+def update_cubes(output_path, touched_weeks, replaced):
+    """
+    Rebuild the aggregate cubes of replaced sources and splice in touched weeks
+    
+    Args:
+        output_path (str): Path of the processed data store
+        touched_weeks (dict): Source key mapped to the YearWeek values that got new rows
+        replaced (set): Keys of sources whose table was replaced
+    """
+    for key, (cube_table, build_cube) in CUBES.items():
+        table = SOURCES[key]['table']
+        
+        if key in replaced or not table_exists(cube_table, output_path):
+            cube_df = build_cube(read_table(table, data_path=output_path))
+        elif touched_weeks[key]:
+            weeks = sorted(touched_weeks[key])
+            updated_df = build_cube(read_table(table, data_path=output_path, weeks=weeks))
+            cube_df = read_table(cube_table, data_path=output_path)
+            cube_df = pd.concat([cube_df[~cube_df['YearWeek'].isin(weeks)], updated_df], ignore_index=True)
+        else:
+            continue
+        
+        path = write_table(cube_df, cube_table, output_path)
+        print(f"Updated aggregate cube: {path}")
+
+def update_weekly_totals(output_path, totals, replaced):
+    """
+    Add the totals of newly ingested rows to the weekly totals tables
+    
+    Args:
+        output_path (str): Path of the processed data store
+        totals (dict): Source key mapped to the weekly totals of its ingested
+            rows, None when it got none
+        replaced (set): Keys of sources whose table was replaced; their
+            totals cover the whole table
+    """
+    for key, (weekly_table, aggregate, columns) in WEEKLY_TOTALS.items():
+        table = SOURCES[key]['table']
+        
+        if key in replaced:
+            weekly_totals = totals.get(key)
+        elif not table_exists(weekly_table, output_path):
+            if not table_exists(table, output_path):
+                continue
+            # Stores processed before the weekly table existed hold no totals to
+            # add to; the stored rows have their missing values filled
+            weekly_totals = aggregate(read_table(table, columns=columns, data_path=output_path))
+        elif totals.get(key) is not None:
+            stored_df = read_table(weekly_table, data_path=output_path)
+            weekly_totals = add_totals(stored_df.set_index(list(totals[key].index.names)), totals[key])
+        else:
+            continue
+        
+        path = write_table(totals_table(weekly_totals, columns + ['Runs']), weekly_table, output_path)
+        print(f"Updated weekly totals: {path}")
+
+def run_incremental_pipeline(output_path, workers=1):
+    """
+    Ingest only export files and rows not yet recorded in the ingest manifest
+    
+    Append-only sources get the rows they do not hold yet, from their
+    watermark on, appended to the store, and only the YearWeek aggregates
+    those rows touch are recomputed.
+    Snapshot sources are reprocessed when their latest export changes.
+    
+    Args:
+        output_path (str): Path of the processed data store
+        workers (int): Number of worker processes ingesting sources in parallel
+    """
+    manifest = read_manifest(output_path)
+    missing_tables = [config['table'] for config in SOURCES.values()
+                      if config['required'] and not table_exists(config['table'], output_path)]
+    if not manifest or missing_tables:
+        print("No ingest manifest or processed tables found, running a full rebuild")
+        run_full_pipeline(output_path, workers)
+        return
+    
+    source_files = find_source_files()
+    tasks = [
+        (key, paths, manifest.get(key, {'watermark': None, 'files': {}}), output_path)
+        for key, paths in source_files.items() if paths
+    ]
+    touched_weeks = {key: set() for key in SOURCES}
+    replaced = set()
+    weekly_totals = {}
+    for key, entry, weeks, was_replaced, categories, totals in run_in_pool(ingest_source_incremental, tasks, workers):
+        update_categories(categories, SOURCES[key]['table'], output_path)
+        manifest[key] = entry
+        touched_weeks[key] = weeks
+        weekly_totals[key] = totals
+        if was_replaced:
+            replaced.add(key)
+    
+    # Recompute only the weekly aggregates touched by the new rows
+    aggregates_changed = False
+    for key, (weekly_table, metrics) in WEEKLY_AGGREGATES.items():
+        table = SOURCES[key]['table']
+        columns = ['YearWeek'] + list(metrics)
+        
+        if key in replaced or not table_exists(weekly_table, output_path):
+            weekly_df = aggregate_weekly(read_table(table, columns=columns, data_path=output_path), metrics)
+        elif touched_weeks[key]:
+            weeks = sorted(touched_weeks[key])
+            print(f"Recomputing {SOURCES[key]['label']} aggregates for weeks: {', '.join(map(str, weeks))}")
+            updated_df = aggregate_weekly(read_table(table, columns=columns, data_path=output_path, weeks=weeks), metrics, weeks)
+            weekly_df = read_table(weekly_table, data_path=output_path)
+            weekly_df = pd.concat([weekly_df[~weekly_df['YearWeek'].isin(weeks)], updated_df], ignore_index=True)
+            weekly_df = weekly_df.sort_values('YearWeek').reset_index(drop=True)
+        else:
+            continue
+        
+        write_table(weekly_df, weekly_table, output_path)
+        aggregates_changed = True
+    
+    update_cubes(output_path, touched_weeks, replaced)
+    update_weekly_totals(output_path, weekly_totals, replaced)
+    
+    if aggregates_changed:
+        print("\nCalculating correlation metrics...")
+        correlation_df, correlation_matrix = correlate_weekly(
+            read_table(WEEKLY_MAINTENANCE_TABLE, data_path=output_path),
+            read_table(WEEKLY_UTILIZATION_TABLE, data_path=output_path)
+        )
+        export_correlation(correlation_df, correlation_matrix, output_path)
+    else:
+        print("\nNo new rows found, processed data is up to date")
+    
+    write_manifest(manifest, output_path)
+
+def main(incremental=False, workers=1):
+    """
+    Main function to process the data
+    
+    Args:
+        incremental (bool): Only ingest export files and rows not yet processed
+        workers (int): Number of worker processes ingesting sources in parallel
+    """
+    print("Starting data processing...")
+    
+    # Create output directory
+    output_path = create_output_directory("processed_data")
+    if not output_path:
+        return
+    
+    if incremental:
+        run_incremental_pipeline(output_path, workers)
+    else:
+        run_full_pipeline(output_path, workers)
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Process LTR exports into the processed data store")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only ingest export files and rows not recorded in the ingest manifest")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes ingesting sources in parallel (default: 1)")
+    args = parser.parse_args()
+    main(incremental=args.incremental, workers=args.workers)
@@ -0,0 +1,857 @@
+import os
+import json
+import shutil
+import hashlib
+import operator
+from functools import lru_cache
+import pandas as pd
+import pyarrow.parquet as pq
+from date_parsing import parse_date_column
+
+# Constants
+DATA_PATH = "processed_data"
+STORE_EXTENSION = ".parquet"
+LEGACY_EXTENSION = ".csv"
+MANIFEST_FILE = "ingest_manifest.json"
+CATEGORIES_FILE = "categories.json"
+HASH_SUFFIX = ".sha256"
+ROW_GROUP_SIZE = 10000
+PARTITION_MANIFEST_FILE = "_partitions.json"
+NULL_PARTITION = "__null__"
+FILTER_OPERATORS = {'>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+# Typed DataFrames cached on disk by table content hash. Point LTR_CACHE_DIR
+# at a directory every dashboard replica on the host can reach.
+CACHE_DIR = os.environ.get("LTR_CACHE_DIR", os.path.join(DATA_PATH, ".cache"))
+
+# Cached DataFrames are stored as Arrow IPC files, which are read back as data
+# rather than unpickled. Beyond these limits the least recently used entries
+# of the cache directory are removed.
+CACHE_EXTENSION = ".arrow"
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 1024 ** 3
+
+EPICS_TABLE = "processed_epics"
+MAINTENANCE_TABLE = "processed_maintenance"
+UTILIZATION_TABLE = "processed_utilization"
+CORRELATION_TABLE = "correlation_data"
+DESKTOP_FLOWS_TABLE = "processed_desktop_flows"
+MACHINE_AVAILABILITY_TABLE = "processed_machine_availability"
+CLOUD_FLOWS_TABLE = "processed_cloud_flows"
+SP_UOW_TABLE = "processed_sp_uow"
+COMBINE_ALL_TABLE = "processed_combine_all"
+WEEKLY_MAINTENANCE_TABLE = "weekly_maintenance"
+WEEKLY_UTILIZATION_TABLE = "weekly_utilization"
+WEEKLY_COMBINE_ALL_TABLE = "weekly_combine_all"
+EPICS_CUBE_TABLE = "cube_epics"
+MAINTENANCE_CUBE_TABLE = "cube_maintenance"
+UTILIZATION_CUBE_TABLE = "cube_utilization"
+
+# Date column each table is sorted and range-filtered on. Tables are written
+# sorted by it in row groups of ROW_GROUP_SIZE rows, so the Parquet row group
+# statistics let a date range read skip every group outside the range.
+FILTER_COLUMNS = {
+    EPICS_TABLE: 'created',
+    MAINTENANCE_TABLE: 'created',
+    UTILIZATION_TABLE: 'Created On',
+    DESKTOP_FLOWS_TABLE: 'Created On',
+    MACHINE_AVAILABILITY_TABLE: 'Created On',
+    CLOUD_FLOWS_TABLE: 'DateTimeStarted',
+    SP_UOW_TABLE: 'DateTimeStarted',
+    COMBINE_ALL_TABLE: 'DateTimeStarted',
+    EPICS_CUBE_TABLE: 'Day',
+    MAINTENANCE_CUBE_TABLE: 'Day',
+    UTILIZATION_CUBE_TABLE: 'Day'
+}
+
+# Run history tables stored as one directory per ISO week, e.g.
+# processed_utilization/YearWeek=202516/part.parquet, with a partition
+# manifest so readers open only the weeks they need
+PARTITIONED_TABLES = [UTILIZATION_TABLE, DESKTOP_FLOWS_TABLE, CLOUD_FLOWS_TABLE, SP_UOW_TABLE, COMBINE_ALL_TABLE]
+
+# Weekly tables are range-filtered on their YearWeek key instead
+WEEK_FILTER_TABLES = [CORRELATION_TABLE, WEEKLY_MAINTENANCE_TABLE, WEEKLY_UTILIZATION_TABLE, WEEKLY_COMBINE_ALL_TABLE]
+
+# Date columns per processed table, used when reading legacy CSV outputs
+DATE_COLUMNS = {
+    EPICS_TABLE: ['created', 'updated', 'duedate', 'Completed Date', 'Start Date'],
+    MAINTENANCE_TABLE: ['created', 'updated', 'duedate', 'Updated Completed Date', 'Start Date', 'Completed Date'],
+    UTILIZATION_TABLE: ['Created On', 'Start', 'End', 'Date', 'Start UTC', 'End UTC'],
+    CORRELATION_TABLE: [],
+    DESKTOP_FLOWS_TABLE: ['Created On', 'Completed On', 'Started On', 'DateTimeStarted_DATE_Only'],
+    MACHINE_AVAILABILITY_TABLE: ['Created On', 'Start', 'End', 'Date', 'Start UTC', 'End UTC'],
+    CLOUD_FLOWS_TABLE: ['startedon', 'LastModified', 'DateTimeStarted', 'DateTimeCompleted', 'DateTimeStarted_DATE_Only'],
+    SP_UOW_TABLE: ['DateTimeStarted', 'DateTimeCompleted', 'startedon', 'DateTimeStarted_DATE_Only'],
+    COMBINE_ALL_TABLE: ['DateTimeStarted', 'DateTimeCompleted', 'DateTimeStarted_DATE_Only', 'DateTimeStarted_Central',
+                        'DateTimeCompleted_Central', 'startedon', 'LastModified', 'Min_Start_Date_2']
+}
+
+def table_path(name, data_path=DATA_PATH, extension=STORE_EXTENSION):
+    """
+    Build the path of a table in the processed data store
+
+    Args:
+        name (str): Table name, e.g. 'processed_epics'
+        data_path (str): Directory of the processed data store
+        extension (str): File extension of the table
+
+    Returns:
+        str: Path to the table file
+    """
+    return os.path.join(data_path, f"{name}{extension}")
+
+def _write_parquet(df, name, path):
+    """
+    Write one Parquet file of a table, sorted by the table's filter column
+
+    Args:
+        df (pandas.DataFrame): DataFrame to write
+        name (str): Table name
+        path (str): Path of the Parquet file
+    """
+    sort_column = FILTER_COLUMNS.get(name)
+    if sort_column in df.columns:
+        df = df.sort_values(sort_column, kind='stable', na_position='last', ignore_index=True)
+    df.to_parquet(path, engine='pyarrow', index=False, row_group_size=ROW_GROUP_SIZE)
+
+def write_table(df, name, data_path=DATA_PATH):
+    """
+    Write a DataFrame to the columnar store as a Parquet file
+
+    The pandas schema is preserved, so datetime columns stay datetimes and
+    categorical columns are stored dictionary-encoded. Tables with a filter
+    column are written sorted by it, and tables in PARTITIONED_TABLES are
+    written as one file per YearWeek (see write_partitions).
+
+    Args:
+        df (pandas.DataFrame): DataFrame to write
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        str: Path to the written file, or to the partition directory
+    """
+    if name in PARTITIONED_TABLES and 'YearWeek' in df.columns:
+        return write_partitions(df, name, data_path)
+
+    path = table_path(name, data_path)
+    _write_parquet(df, name, path)
+    
+    # Record the content hash next to the table so readers can key caches by it
+    with open(f"{path}{HASH_SUFFIX}", 'w') as f:
+        f.write(file_sha256(path))
+    return path
+
+def partition_directory(name, data_path=DATA_PATH):
+    """
+    Build the path of a partitioned table's directory
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        str: Path to the partition directory
+    """
+    return table_path(name, data_path, extension="")
+
+def read_partition_manifest(name, data_path=DATA_PATH):
+    """
+    Read the partition manifest of a partitioned table
+
+    The manifest maps each YearWeek partition ('__null__' for rows without a
+    week) to its file, row count, filter column bounds and content hash.
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        dict: Manifest with 'columns' and 'partitions', or None if the table
+        is not stored partitioned
+    """
+    path = os.path.join(partition_directory(name, data_path), PARTITION_MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_partitions(df, name, data_path=DATA_PATH, replace_all=True):
+    """
+    Write a table as one Parquet file per YearWeek partition
+
+    Partition files and the manifest are each replaced atomically, and the
+    partitions dropped from the table are deleted last, so a concurrent
+    reader sees either the old or the new file of every partition.
+
+    Args:
+        df (pandas.DataFrame): Rows to write; must have a YearWeek column
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+        replace_all (bool): Replace the whole table. When False only the
+            partitions present in df are rewritten and the others are kept.
+
+    Returns:
+        str: Path to the partition directory
+    """
+    directory = partition_directory(name, data_path)
+    os.makedirs(directory, exist_ok=True)
+
+    manifest = None if replace_all else read_partition_manifest(name, data_path)
+    if manifest is None:
+        manifest = {'columns': df.columns.tolist(), 'partitions': {}}
+    else:
+        manifest['columns'] += [col for col in df.columns if col not in manifest['columns']]
+    written = set()
+
+    filter_column = FILTER_COLUMNS.get(name)
+    labels = df['YearWeek'].astype('string').fillna(NULL_PARTITION)
+    for label, part_df in df.groupby(labels, sort=True):
+        relative_path = os.path.join(f"YearWeek={label}", "part.parquet")
+        path = os.path.join(directory, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Readers never see a partially written file: each partition is
+        # written aside and moved over the old one in a single step
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        _write_parquet(part_df, name, tmp_path)
+        sha256 = file_sha256(tmp_path)
+        os.replace(tmp_path, path)
+
+        entry = {'path': relative_path, 'rows': len(part_df), 'min': None, 'max': None, 'sha256': sha256}
+        if filter_column in part_df.columns and part_df[filter_column].notna().any():
+            entry['min'] = part_df[filter_column].min().isoformat()
+            entry['max'] = part_df[filter_column].max().isoformat()
+        manifest['partitions'][label] = entry
+        written.add(label)
+
+    manifest_path = os.path.join(directory, PARTITION_MANIFEST_FILE)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+    # Stale partitions are removed only once the new manifest no longer lists them
+    if replace_all:
+        for label in os.listdir(directory):
+            if label.startswith("YearWeek=") and label.split("=", 1)[1] not in written:
+                shutil.rmtree(os.path.join(directory, label), ignore_errors=True)
+
+    # Remove the flat file an older processor wrote for this table
+    flat_path = table_path(name, data_path)
+    for stale in (flat_path, f"{flat_path}{HASH_SUFFIX}"):
+        if os.path.exists(stale):
+            os.remove(stale)
+    return directory
+
+def append_table(df, name, data_path=DATA_PATH):
+    """
+    Append rows to a stored table
+
+    Partitioned tables only rewrite the YearWeek partitions the new rows
+    fall in; other tables are read and rewritten whole.
+
+    Args:
+        df (pandas.DataFrame): Rows to append
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        str: Path to the written file, or to the partition directory
+    """
+    manifest = read_partition_manifest(name, data_path)
+    if manifest is None or 'YearWeek' not in df.columns:
+        existing_df = read_table(name, data_path=data_path)
+        return write_table(pd.concat([existing_df, df], ignore_index=True), name, data_path)
+
+    weeks = df['YearWeek'].dropna().unique().tolist()
+    existing_df = read_table(name, data_path=data_path, weeks=weeks)
+    if df['YearWeek'].isna().any() and NULL_PARTITION in manifest['partitions']:
+        null_path = os.path.join(partition_directory(name, data_path), manifest['partitions'][NULL_PARTITION]['path'])
+        existing_df = pd.concat([existing_df, pd.read_parquet(null_path, engine='pyarrow')], ignore_index=True)
+    # Rows of new weeks have no stored rows to join
+    if existing_df.empty:
+        return write_partitions(df, name, data_path, replace_all=False)
+    return write_partitions(pd.concat([existing_df, df], ignore_index=True), name, data_path, replace_all=False)
+
+def partition_weeks(name, data_path=DATA_PATH):
+    """
+    List the YearWeek partitions of a partitioned table
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        list: Sorted YearWeek keys, or None if the table is not partitioned
+    """
+    manifest = read_partition_manifest(name, data_path)
+    if manifest is None:
+        return None
+    return sorted(int(label) for label in manifest['partitions'] if label != NULL_PARTITION)
+
+def table_columns(name, data_path=DATA_PATH):
+    """
+    List the columns of a stored table without reading its data
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        list: Column names, or None if the table does not exist
+    """
+    manifest = read_partition_manifest(name, data_path)
+    if manifest is not None:
+        return manifest['columns']
+
+    path = table_path(name, data_path)
+    if os.path.exists(path):
+        return pq.read_schema(path).names
+
+    legacy_path = table_path(name, data_path, LEGACY_EXTENSION)
+    if os.path.exists(legacy_path):
+        return pd.read_csv(legacy_path, nrows=0).columns.tolist()
+
+    return None
+
+def week_key(date):
+    """
+    Get the integer YearWeek key (ISO year * 100 + ISO week) of a date
+
+    Args:
+        date: Date, datetime or date string
+
+    Returns:
+        int: YearWeek key, e.g. 202516
+    """
+    iso = pd.Timestamp(date).isocalendar()
+    return iso[0] * 100 + iso[1]
+
+def date_filters(name, date_range):
+    """
+    Build the Parquet row filters selecting a date range of a table
+
+    Args:
+        name (str): Table name
+        date_range (tuple): Inclusive (start, end) dates, or None
+
+    Returns:
+        list: Filters for pyarrow, or None if the range is None or the table
+        has no filter column
+    """
+    if date_range is None:
+        return None
+
+    start, end = date_range
+    if name in FILTER_COLUMNS:
+        column = FILTER_COLUMNS[name]
+        return [(column, '>=', pd.Timestamp(start)),
+                (column, '<', pd.Timestamp(end).normalize() + pd.Timedelta(days=1))]
+    if name in WEEK_FILTER_TABLES:
+        return [('YearWeek', '>=', week_key(start)), ('YearWeek', '<=', week_key(end))]
+    return None
+
+def read_table(name, columns=None, data_path=DATA_PATH, date_range=None, weeks=None):
+    """
+    Read a table from the columnar store
+
+    Falls back to the legacy CSV output when no Parquet file exists yet, in
+    which case the known date columns are converted after reading.
+
+    Args:
+        name (str): Table name
+        columns (list): Columns to read; None reads every column. Columns
+            missing from the table are ignored.
+        data_path (str): Directory of the processed data store
+        date_range (tuple): Optional inclusive (start, end) dates. Only rows
+            whose filter column (see FILTER_COLUMNS) falls in the range are
+            read; weekly tables are filtered by YearWeek.
+        weeks (list): Optional YearWeek keys to read; only those partitions
+            of a partitioned table are opened
+
+    Returns:
+        pandas.DataFrame: The stored table
+    """
+    available = table_columns(name, data_path)
+    if available is None:
+        raise FileNotFoundError(f"Table '{name}' not found in {data_path}")
+
+    if columns is not None:
+        columns = [col for col in columns if col in available]
+
+    filters = date_filters(name, date_range)
+    if filters and filters[0][0] not in available:
+        filters = None
+    if weeks is not None and 'YearWeek' in available:
+        filters = (filters or []) + [('YearWeek', 'in', [int(week) for week in weeks])]
+
+    categories = read_categories(name, data_path)
+    manifest = read_partition_manifest(name, data_path)
+    if manifest is not None:
+        try:
+            return _read_partitions(name, manifest, columns, data_path, date_range, weeks, filters, categories)
+        except FileNotFoundError:
+            # A concurrent write removed a partition after the manifest was read
+            manifest = read_partition_manifest(name, data_path)
+            return _read_partitions(name, manifest, columns, data_path, date_range, weeks, filters, categories)
+
+    path = table_path(name, data_path)
+    if os.path.exists(path):
+        return apply_categories(pd.read_parquet(path, engine='pyarrow', columns=columns, filters=filters), categories)
+
+    usecols = columns
+    if filters and columns is not None:
+        usecols = columns + [column for column, _, _ in filters if column not in columns]
+    df = pd.read_csv(table_path(name, data_path, LEGACY_EXTENSION), usecols=usecols)
+    for col in DATE_COLUMNS.get(name, []):
+        if col in df.columns:
+            df[col], _ = parse_date_column(df[col], source=name, column=col)
+
+    if filters:
+        mask = pd.Series(True, index=df.index)
+        for column, op, value in filters:
+            if op == 'in':
+                mask &= df[column].isin(value)
+            else:
+                mask &= FILTER_OPERATORS[op](df[column], value)
+        df = df.loc[mask].reset_index(drop=True)
+        if columns is not None:
+            df = df[columns]
+    return apply_categories(df, categories)
+
+def _read_partitions(name, manifest, columns, data_path, date_range, weeks, filters, categories):
+    """
+    Read the partitions of a partitioned table that can hold requested rows
+
+    Partitions are pruned by YearWeek and by the filter column bounds
+    recorded in the manifest before any file is opened.
+
+    Args:
+        name (str): Table name
+        manifest (dict): Partition manifest of the table
+        columns (list): Columns to read, already limited to existing ones
+        data_path (str): Directory of the processed data store
+        date_range (tuple): Optional inclusive (start, end) dates
+        weeks (list): Optional YearWeek keys to read
+        filters (list): Row filters for the partitions that are opened
+        categories (dict): Shared category dictionaries, see read_categories
+
+    Returns:
+        pandas.DataFrame: Rows of the selected partitions
+    """
+    directory = partition_directory(name, data_path)
+    week_labels = None if weeks is None else {str(int(week)) for week in weeks}
+    if date_range is not None:
+        start = pd.Timestamp(date_range[0])
+        end = pd.Timestamp(date_range[1]).normalize() + pd.Timedelta(days=1)
+
+    paths = []
+    for label, entry in sorted(manifest['partitions'].items()):
+        if week_labels is not None and label not in week_labels:
+            continue
+        if date_range is not None and name in FILTER_COLUMNS:
+            if entry['min'] is None or pd.Timestamp(entry['max']) < start or pd.Timestamp(entry['min']) >= end:
+                continue
+        paths.append(os.path.join(directory, entry['path']))
+
+    # Every partition gets the shared categories so concat keeps them categorical
+    frames = [apply_categories(pd.read_parquet(path, engine='pyarrow', columns=columns, filters=filters), categories)
+              for path in paths]
+    if not frames:
+        # Keep the stored dtypes on an empty result
+        first_entry = next(iter(manifest['partitions'].values()), None)
+        if first_entry is None:
+            return pd.DataFrame(columns=columns if columns is not None else manifest['columns'])
+        schema = pq.read_schema(os.path.join(directory, first_entry['path']))
+        empty_df = apply_categories(schema.empty_table().to_pandas(), categories)
+        return empty_df[columns] if columns is not None else empty_df
+    return pd.concat(frames, ignore_index=True)
+
+def date_bounds(name, data_path=DATA_PATH):
+    """
+    Get the first and last date of a table's filter column
+
+    Parquet tables are answered from the row group statistics without
+    reading any data.
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        tuple: (min, max) pandas Timestamps, or (None, None) if the table or
+        its filter column does not exist or holds no dates
+    """
+    column = FILTER_COLUMNS.get(name)
+    available = table_columns(name, data_path)
+    if column is None or available is None or column not in available:
+        return None, None
+
+    manifest = read_partition_manifest(name, data_path)
+    if manifest is not None:
+        entries = [entry for entry in manifest['partitions'].values() if entry['min'] is not None]
+        if not entries:
+            return None, None
+        return (min(pd.Timestamp(entry['min']) for entry in entries),
+                max(pd.Timestamp(entry['max']) for entry in entries))
+
+    path = table_path(name, data_path)
+    if os.path.exists(path):
+        metadata = pq.ParquetFile(path).metadata
+        index = metadata.schema.to_arrow_schema().get_field_index(column)
+        lows, highs = [], []
+        for group in range(metadata.num_row_groups):
+            stats = metadata.row_group(group).column(index).statistics
+            if stats is not None and stats.has_min_max:
+                lows.append(pd.Timestamp(stats.min))
+                highs.append(pd.Timestamp(stats.max))
+        if not lows:
+            return None, None
+        return min(lows), max(highs)
+
+    dates = read_table(name, columns=[column], data_path=data_path)[column]
+    if dates.isna().all():
+        return None, None
+    return dates.min(), dates.max()
+
+def table_exists(name, data_path=DATA_PATH):
+    """
+    Check whether a table exists in the processed data store
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        bool: True if the table has a Parquet or legacy CSV file
+    """
+    return table_columns(name, data_path) is not None
+
+def read_manifest(data_path=DATA_PATH):
+    """
+    Read the ingest manifest of the processed data store
+
+    Args:
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        dict: Manifest keyed by source, empty if none was written yet
+    """
+    path = os.path.join(data_path, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_manifest(manifest, data_path=DATA_PATH):
+    """
+    Write the ingest manifest of the processed data store
+
+    Args:
+        manifest (dict): Manifest keyed by source
+        data_path (str): Directory of the processed data store
+    """
+    path = os.path.join(data_path, MANIFEST_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+@lru_cache(maxsize=8)
+def _load_categories(path, mtime_ns, size):
+    """
+    Parse a categories file, once per version of it
+
+    Args:
+        path (str): Path of the categories file
+        mtime_ns (int): Modification time of the file; part of the cache key
+        size (int): Size of the file; part of the cache key
+
+    Returns:
+        dict: Table name mapped to its column dictionaries
+    """
+    with open(path, 'r') as f:
+        categories = json.load(f)
+    # Files written before the dictionaries were kept per table hold lists at
+    # the top level; they are ignored until the processor rewrites them
+    if any(isinstance(value, list) for value in categories.values()):
+        return {}
+    return categories
+
+def _read_category_file(data_path=DATA_PATH):
+    """Read the category dictionaries of every table; the result is shared, do not modify it"""
+    path = os.path.join(data_path, CATEGORIES_FILE)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    return _load_categories(path, stat.st_mtime_ns, stat.st_size)
+
+def read_categories(name, data_path=DATA_PATH):
+    """
+    Read the category dictionaries shared by the files of a table
+
+    The file is parsed once per version and the result is shared between
+    callers, so it must not be modified.
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        dict: Column name mapped to its ordered list of categories, empty if
+        none were recorded yet
+    """
+    return _read_category_file(data_path).get(name, {})
+
+def update_categories(categories, name, data_path=DATA_PATH):
+    """
+    Merge categories into the shared dictionaries of a table
+
+    New values are appended, so the codes of values already recorded never
+    change between processor runs.
+
+    Args:
+        categories (dict): Column name mapped to the categories seen
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        dict: The merged dictionaries of the table
+    """
+    shared = {table: {col: list(values) for col, values in columns.items()}
+              for table, columns in _read_category_file(data_path).items()}
+    table_shared = shared.setdefault(name, {})
+    for col, values in categories.items():
+        known = table_shared.setdefault(col, [])
+        known_set = set(known)
+        for value in values:
+            if value not in known_set:
+                known.append(value)
+                known_set.add(value)
+
+    path = os.path.join(data_path, CATEGORIES_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(shared, f, indent=2)
+    os.replace(tmp_path, path)
+    return table_shared
+
+def apply_categories(df, categories):
+    """
+    Store the columns with a shared dictionary as categoricals using it
+
+    Values missing from a dictionary are appended to it for this DataFrame
+    only, so no value is lost.
+
+    Args:
+        df (pandas.DataFrame): DataFrame to convert in place
+        categories (dict): Shared category dictionaries, see read_categories
+
+    Returns:
+        pandas.DataFrame: df with converted columns
+    """
+    for col in df.columns.intersection(list(categories)):
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            seen = values.cat.categories
+        elif values.dtype == object:
+            seen = values.dropna().unique()
+        else:
+            continue
+
+        shared = categories[col]
+        shared_set = set(shared)
+        unseen = [value for value in seen if value not in shared_set]
+        dtype = pd.CategoricalDtype(shared + unseen)
+        if values.dtype != dtype:
+            df[col] = values.astype(dtype)
+    return df
+
+def drop_unused_categories(df):
+    """
+    Drop the categories no row uses from the categorical columns
+
+    Charting libraries such as plotly group by every category of a
+    categorical column, so frames are trimmed to their observed values
+    before being charted.
+
+    Args:
+        df (pandas.DataFrame): DataFrame with categorical columns
+
+    Returns:
+        pandas.DataFrame: New DataFrame with trimmed categories, or df itself
+        if it has no categorical column
+    """
+    columns = {col: df[col].cat.remove_unused_categories() for col in df.select_dtypes(include=['category']).columns}
+    return df.assign(**columns) if columns else df
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """
+    Hash a file's content without loading it into memory at once
+
+    Args:
+        path (str): Path to the file
+        chunk_size (int): Number of bytes read per step
+
+    Returns:
+        str: Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def file_fingerprint(path, previous=None):
+    """
+    Fingerprint an export file by size, mtime and content hash
+
+    The content hash is only recomputed when size or mtime differ from the
+    previous fingerprint, so unchanged files are detected with a single stat.
+
+    Args:
+        path (str): Path to the file
+        previous (dict): Fingerprint recorded in the manifest, if any
+
+    Returns:
+        tuple: (changed, fingerprint) where changed is False when the file
+        content matches the previous fingerprint
+    """
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime': stat.st_mtime}
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime') == stat.st_mtime:
+        fingerprint['sha256'] = previous['sha256']
+        return False, fingerprint
+
+    fingerprint['sha256'] = file_sha256(path)
+    changed = not previous or previous.get('sha256') != fingerprint['sha256']
+    return changed, fingerprint
+
+def table_version(name, data_path=DATA_PATH):
+    """
+    Get the version of a stored table for cache keys
+
+    Args:
+        name (str): Table name
+        data_path (str): Directory of the processed data store
+
+    Returns:
+        str: Content hash written by write_table (of the partition manifest
+        for partitioned tables), or a size and mtime stamp
+        for tables without one (e.g. legacy CSV outputs); None if the table
+        does not exist
+    """
+    manifest_path = os.path.join(partition_directory(name, data_path), PARTITION_MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        # The manifest records every partition's content hash
+        return file_sha256(manifest_path)
+
+    path = table_path(name, data_path)
+    hash_path = f"{path}{HASH_SUFFIX}"
+    if os.path.exists(path) and os.path.exists(hash_path):
+        with open(hash_path, 'r') as f:
+            return f.read().strip()
+
+    for candidate in (path, table_path(name, data_path, LEGACY_EXTENSION)):
+        if os.path.exists(candidate):
+            stat = os.stat(candidate)
+            return f"stat-{stat.st_size}-{stat.st_mtime_ns}"
+    return None
+
+def prune_cache(cache_dir=None, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES):
+    """
+    Remove the least recently used cache entries beyond the cache limits
+
+    Entries are ordered by mtime, which read_table_cached refreshes on every
+    hit; atime is not used as many filesystems do not keep it up to date.
+    The most recent entry is always kept.
+
+    Args:
+        cache_dir (str): Cache directory; defaults to CACHE_DIR
+        max_entries (int): Most entries kept
+        max_bytes (int): Most bytes kept across the entries
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    entries = []
+    for file in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, file)
+        if file.endswith(".pkl"):
+            # Entries of the former pickle format are never read again
+            entries.append((-1, 0, path))
+        elif file.endswith(CACHE_EXTENSION):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    entries.sort(reverse=True)
+    total_bytes = 0
+    for index, (mtime, size, path) in enumerate(entries):
+        total_bytes += size
+        if index > 0 and (mtime < 0 or index >= max_entries or total_bytes > max_bytes):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def read_table_cached(name, columns=None, data_path=DATA_PATH, cache_dir=None, date_range=None, weeks=None):
+    """
+    Read a table through the on-disk cache of typed DataFrames
+
+    Entries are keyed by the table version, the requested columns, date
+    range and weeks, so a table rewritten by the processor gets new entries, and
+    the entries of its older versions are removed. The cache is kept within
+    CACHE_MAX_ENTRIES and CACHE_MAX_BYTES, see prune_cache.
+
+    Args:
+        name (str): Table name
+        columns (list): Columns to read; None reads every column
+        data_path (str): Directory of the processed data store
+        cache_dir (str): Cache directory; defaults to CACHE_DIR
+        date_range (tuple): Optional inclusive (start, end) dates, see read_table
+        weeks (list): Optional YearWeek keys to read, see read_table
+
+    Returns:
+        pandas.DataFrame: The stored table
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    version = table_version(name, data_path)
+    if version is None:
+        raise FileNotFoundError(f"Table '{name}' not found in {data_path}")
+
+    version_key = hashlib.sha256(version.encode()).hexdigest()[:16]
+    request = columns
+    if date_range is not None or weeks is not None:
+        request = [columns, None if date_range is None else [str(date) for date in date_range],
+                   None if weeks is None else [int(week) for week in weeks]]
+    columns_key = hashlib.sha256(json.dumps(request).encode()).hexdigest()[:8]
+    cache_path = os.path.join(cache_dir, f"{name}-{version_key}-{columns_key}{CACHE_EXTENSION}")
+
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_feather(cache_path)
+            # Mark the entry as recently used for prune_cache
+            os.utime(cache_path)
+            return df
+        except Exception as e:
+            print(f"Ignoring unreadable cache entry {cache_path}: {e}")
+
+    df = read_table(name, columns=columns, data_path=data_path, date_range=date_range, weeks=weeks)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        df.reset_index(drop=True).to_feather(tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        # Drop entries of older versions of this table
+        for file in os.listdir(cache_dir):
+            if file.startswith(f"{name}-") and file.endswith(CACHE_EXTENSION) and not file.startswith(f"{name}-{version_key}-"):
+                os.remove(os.path.join(cache_dir, file))
+        prune_cache(cache_dir)
+    except (OSError, ValueError) as e:
+        print(f"Could not write cache entry {cache_path}: {e}")
+
+    return df
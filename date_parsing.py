@@ -0,0 +1,89 @@
+import pandas as pd
+
+# Candidate formats of the export date columns, tried in order. ISO8601 covers
+# both "2025-04-14T06:16:00" and fractional seconds like "2025-04-14T02:57:12.28".
+DATE_FORMATS = ['ISO8601', '%m/%d/%Y %I:%M:%S %p', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y']
+SAMPLE_SIZE = 200
+
+# Empty times of the exports come through as Excel's epoch day shifted to the
+# column's time zone, e.g. "1899-12-30T06:00:00" for a run that never completed
+EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+
+# Detected format per (source, column); None means no candidate matched
+_format_cache = {}
+
+def detect_date_format(values, sample_size=SAMPLE_SIZE):
+    """
+    Detect the format of a date column from a sample of its values
+
+    Args:
+        values (pandas.Series): Raw date strings
+        sample_size (int): Number of non-null values to test
+
+    Returns:
+        str: The first format in DATE_FORMATS that parses the whole sample,
+        or None if none does
+    """
+    sample = values.dropna()
+    sample = sample.iloc[:sample_size].astype(str)
+    if sample.empty:
+        return None
+
+    for fmt in DATE_FORMATS:
+        try:
+            pd.to_datetime(sample, format=fmt, errors='raise')
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+def get_date_format(values, source=None, column=None):
+    """
+    Get the cached format of a source column, detecting it on first use
+
+    Args:
+        values (pandas.Series): Raw date strings
+        source (str): Name of the export or table the column comes from
+        column (str): Column name; defaults to the Series name
+
+    Returns:
+        str: Date format, or None if it could not be detected
+    """
+    key = (source, column if column is not None else values.name)
+    if key not in _format_cache:
+        _format_cache[key] = detect_date_format(values)
+    return _format_cache[key]
+
+def parse_date_column(values, source=None, column=None):
+    """
+    Parse a date column with its detected explicit format
+
+    Values on the Excel epoch day (1899-12-30) are empty-value sentinels and
+    become NaT.
+
+    Args:
+        values (pandas.Series): Raw date strings
+        source (str): Name of the export or table the column comes from
+        column (str): Column name; defaults to the Series name
+
+    Returns:
+        tuple: Parsed datetime Series and a report dict with the format used,
+        the number of values coerced to NaT and the number of sentinels
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values, {'format': None, 'coerced': 0, 'sentinels': 0}
+
+    fmt = get_date_format(values, source, column)
+    if fmt is None:
+        parsed = pd.to_datetime(values, errors='coerce')
+    else:
+        parsed = pd.to_datetime(values, format=fmt, errors='coerce')
+
+    coerced = int((parsed.isna() & values.notna()).sum())
+
+    sentinels = parsed.notna() & (parsed.dt.normalize() == EXCEL_EPOCH)
+    sentinel_count = int(sentinels.sum())
+    if sentinel_count:
+        parsed = parsed.mask(sentinels)
+
+    return parsed, {'format': fmt, 'coerced': coerced, 'sentinels': sentinel_count}
@@ -0,0 +1,110 @@
+import datetime
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from data_store import DATA_PATH, read_table
+
+# Rows converted to cell values at a time; bounds the memory of the Python
+# objects built for each sheet regardless of its size
+EXPORT_CHUNK_ROWS = 50000
+
+# Rows per worksheet, including the header row; larger frames continue on
+# numbered overflow sheets
+EXCEL_MAX_ROWS = 1048576
+
+# Longest sheet name Excel accepts
+EXCEL_MAX_SHEET_NAME = 31
+
+# Values openpyxl writes as typed cells; anything else is written as text
+CELL_TYPES = (str, int, float, bool, Decimal, np.number, np.bool_,
+              datetime.date, datetime.time, datetime.timedelta)
+
+def _cell_values(series):
+    """
+    Convert a column to values openpyxl can write
+
+    Missing values become empty cells, timezone-aware dates are written in
+    their local time and unsupported objects as their text.
+
+    Args:
+        series (pandas.Series): Column to convert
+
+    Returns:
+        list: One value per row
+    """
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+    values = series.astype(object).where(series.notna(), None).tolist()
+    if series.dtype == object:
+        values = [value if value is None or isinstance(value, CELL_TYPES) else str(value) for value in values]
+    return values
+
+def _iter_rows(df):
+    """
+    Yield the rows of a DataFrame as lists of cell values, chunk by chunk
+
+    Args:
+        df (pandas.DataFrame): Frame to convert
+
+    Yields:
+        tuple: Cell values of one row
+    """
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        yield from zip(*[_cell_values(chunk[col]) for col in chunk.columns])
+
+def _sheet_title(name, part):
+    """Worksheet title of a sheet's part, numbered from the second part on"""
+    if part == 0:
+        return str(name)[:EXCEL_MAX_SHEET_NAME]
+    suffix = f"_{part + 1}"
+    return str(name)[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+
+def write_sheets(sheets, target):
+    """
+    Write DataFrames to an Excel workbook in write-only mode
+
+    Rows are streamed into the workbook without keeping cell objects in
+    memory. Frames longer than an Excel sheet continue on numbered sheets.
+
+    Args:
+        sheets (dict): Sheet name mapped to its DataFrame; the index is not
+            written
+        target: Path or binary file object to write to
+    """
+    workbook = Workbook(write_only=True)
+    for name, df in sheets.items():
+        header = [str(col) for col in df.columns]
+        part, written = 0, 0
+        worksheet = workbook.create_sheet(title=_sheet_title(name, part))
+        worksheet.append(header)
+        for row in _iter_rows(df):
+            if written == EXCEL_MAX_ROWS - 1:
+                part, written = part + 1, 0
+                worksheet = workbook.create_sheet(title=_sheet_title(name, part))
+                worksheet.append(header)
+            worksheet.append(row)
+            written += 1
+    workbook.save(target)
+
+def export_table(name, target, columns=None, data_path=DATA_PATH, date_range=None, weeks=None,
+                 sheet_name=None):
+    """
+    Export the run-level rows of a stored table to an Excel workbook
+
+    Args:
+        name (str): Table name
+        target: Path or binary file object to write to
+        columns (list): Columns to export; None exports every column
+        data_path (str): Directory of the processed data store
+        date_range (tuple): Optional inclusive (start, end) dates, as for read_table
+        weeks (list): Optional YearWeek keys, as for read_table
+        sheet_name (str): Worksheet name; defaults to the table name
+
+    Returns:
+        int: Number of rows exported
+    """
+    df = read_table(name, columns=columns, data_path=data_path, date_range=date_range, weeks=weeks)
+    write_sheets({sheet_name or name: df}, target)
+    return len(df)
@@ -0,0 +1,345 @@
+import pandas as pd
+from datetime import datetime
+from template_engine import render_report
+
+# Columns the report builders read
+REPORT_COLUMNS = {
+    'epics': ['Key', 'summary', 'Status', 'priority', 'Assignee', 'created', 'duedate', 'Start Date',
+              'Completed Date', 'Estimated Financial Impact'],
+    'maintenance': ['SumMaintenance_Hours', 'Total_Maintenance_Tickets_By_Week',
+                    'Maintenance_Time_Allocation_Percentage'],
+    'utilization': ['Machine_Utilization__', 'SumRuntime_duration__mins_', 'desktop_taskstatus']
+}
+
+# Most rows any report variant lists per section; the shared frames hold this
+# many and each builder takes the head it needs
+REPORT_TOP_K = 5
+
+REPORT_FILES = [
+    "Week16_MainKPI.png",
+    "Week16_WBR_Notes.txt",
+    "SQL_SP_UOW_ALL_2025-04-21 10_01_46 AM.csv"
+]
+
+def top_rows(df, k, column, largest=True):
+    """
+    Select the k rows with the latest (or earliest) values of a column
+
+    Equivalent to sorting by the column and taking the head, without sorting
+    the whole frame. Rows with a missing value come last, as with sort_values.
+
+    Args:
+        df (pandas.DataFrame): Rows to select from
+        k (int): Number of rows
+        column (str): Column to rank by
+        largest (bool): Take the largest values instead of the smallest
+
+    Returns:
+        pandas.DataFrame: Up to k rows in rank order
+    """
+    selected = df.nlargest(k, column) if largest else df.nsmallest(k, column)
+    if len(selected) < k:
+        selected = pd.concat([selected, df[df[column].isna()].head(k - len(selected))])
+    return selected
+
+def date_text(value):
+    """Format a date for a report; None when it is missing, e.g. for a selection without rows"""
+    return None if pd.isna(value) else value.strftime("%Y-%m-%d")
+
+def records(df, fields, k=None):
+    """
+    Extract rows as report records
+
+    Args:
+        df (pandas.DataFrame): Rows to extract
+        fields (dict): Record key mapped to its source column; missing
+            columns give 'N/A'
+        k (int): Optional number of leading rows to extract
+
+    Returns:
+        list: One dict per row
+    """
+    if k is not None:
+        df = df.head(k)
+    extracted = pd.DataFrame(
+        {key: df[col] if col in df.columns else 'N/A' for key, col in fields.items()},
+        index=df.index
+    )
+    return extracted.to_dict('records')
+
+def compute_report_frames(data, top_k=REPORT_TOP_K):
+    """
+    Compute the frames and metrics shared by every report variant
+
+    Args:
+        data (Mapping): 'epics', 'maintenance' and 'utilization' DataFrames
+        top_k (int): Rows kept per ranked section
+
+    Returns:
+        dict: Ranked epic frames ('completed', 'upcoming', 'recent'), the
+        exec LTR view metrics and the detail notes
+    """
+    epics_df = data['epics']
+    maintenance_df = data['maintenance']
+    utilization_df = data['utilization']
+
+    done = epics_df['Status'] == 'Done'
+    total_maintenance_hours = maintenance_df['SumMaintenance_Hours'].sum()
+    avg_utilization = utilization_df['Machine_Utilization__'].mean() * 100
+
+    return {
+        'total_epics': len(epics_df),
+        'completed': top_rows(epics_df[done], top_k, 'Completed Date'),
+        'upcoming': top_rows(epics_df[~done], top_k, 'duedate', largest=False),
+        'recent': top_rows(epics_df, top_k, 'created'),
+        'exec_ltr_view': {
+            'completion_rate': done.mean() * 100,
+            'avg_utilization': avg_utilization,
+            'maintenance_impact': total_maintenance_hours,
+            'success_rate': (utilization_df['desktop_taskstatus'] == 'Succeeded').mean() * 100
+        },
+        'detail_notes': [
+            f"Total Epics: {len(epics_df)}",
+            f"Total Maintenance Hours: {total_maintenance_hours:.1f}",
+            f"Average Machine Utilization: {avg_utilization:.1f}%"
+        ]
+    }
+
+def key_updates(frames, k):
+    """Most recently completed epics"""
+    return records(frames['completed'], {'title': 'summary', 'impact': 'Estimated Financial Impact',
+                                         'date': 'Completed Date'}, k)
+
+def roadmap_updates(frames, k):
+    """Open epics due first"""
+    return records(frames['upcoming'], {'title': 'summary', 'due_date': 'duedate', 'owner': 'Assignee',
+                                        'impact': 'Estimated Financial Impact'}, k)
+
+def deep_dives(frames, k):
+    """Most recently created epics"""
+    return records(frames['recent'], {'title': 'summary', 'status': 'Status', 'priority': 'priority'}, k)
+
+def generate_comprehensive_report(data, frames=None):
+    """
+    Generate a comprehensive report of all data sources and their analysis
+
+    Args:
+        data (Mapping): 'epics', 'maintenance' and 'utilization' DataFrames
+        frames (dict): Shared frames from compute_report_frames; computed
+            from data when not given
+    """
+    frames = frames or compute_report_frames(data)
+    report = {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'data_sources': {},
+        'metrics': {},
+        'insights': [],
+        'recommendations': []
+    }
+
+    # Analyze JIRA Epics Data
+    epics_df = data['epics']
+    report['data_sources']['jira_epics'] = {
+        'total_records': frames['total_epics'],
+        'date_range': {
+            'start': date_text(epics_df['created'].min()),
+            'end': date_text(epics_df['created'].max())
+        },
+        'completion_rate': frames['exec_ltr_view']['completion_rate'],
+        'avg_cycle_time': (pd.to_datetime(epics_df['Completed Date']) - pd.to_datetime(epics_df['Start Date'])).mean().days
+    }
+
+    # Analyze Maintenance Data
+    maintenance_df = data['maintenance']
+    report['data_sources']['maintenance'] = {
+        'total_records': len(maintenance_df),
+        'total_hours': frames['exec_ltr_view']['maintenance_impact'],
+        'avg_tickets_per_week': maintenance_df['Total_Maintenance_Tickets_By_Week'].mean(),
+        'maintenance_allocation': maintenance_df['Maintenance_Time_Allocation_Percentage'].mean()
+    }
+
+    # Analyze Machine Utilization Data
+    utilization_df = data['utilization']
+    total_runtime_hours = utilization_df['SumRuntime_duration__mins_'].sum() / 60
+    report['data_sources']['utilization'] = {
+        'total_records': len(utilization_df),
+        'avg_utilization_rate': frames['exec_ltr_view']['avg_utilization'],
+        'total_available_hours': total_runtime_hours,
+        'total_utilized_hours': total_runtime_hours
+    }
+
+    # Calculate Key Metrics
+    report['metrics'] = {
+        'overall_efficiency': report['data_sources']['utilization']['avg_utilization_rate'],
+        'maintenance_impact': (report['data_sources']['maintenance']['total_hours'] / report['data_sources']['utilization']['total_available_hours']) * 100,
+        'epic_completion_rate': report['data_sources']['jira_epics']['completion_rate']
+    }
+
+    # Generate Insights
+    if report['metrics']['overall_efficiency'] < 80:
+        report['insights'].append("Machine utilization efficiency is below target (80%). Consider optimizing scheduling.")
+
+    if report['metrics']['maintenance_impact'] > 20:
+        report['insights'].append("Maintenance activities are consuming more than 20% of available time. Review maintenance schedules.")
+
+    if report['data_sources']['jira_epics']['avg_cycle_time'] > 14:
+        report['insights'].append("Average epic cycle time exceeds two weeks. Review workflow bottlenecks.")
+
+    # Generate Recommendations
+    report['recommendations'] = [
+        "Implement predictive maintenance scheduling to reduce unplanned downtime",
+        "Review and optimize epic workflow processes to reduce cycle time",
+        "Consider capacity planning based on current utilization patterns"
+    ]
+
+    return report
+
+def generate_rpa_ltr_report(data, frames=None):
+    """
+    Generate RPA LTR report based on the RPA_LTR_Template.txt format
+
+    Args:
+        data (Mapping): 'epics', 'maintenance' and 'utilization' DataFrames
+        frames (dict): Shared frames from compute_report_frames; computed
+            from data when not given
+    """
+    frames = frames or compute_report_frames(data)
+    return {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'key_updates': key_updates(frames, 3),
+        'exec_ltr_view': dict(frames['exec_ltr_view']),
+        'roadmap_updates': roadmap_updates(frames, 4),
+        'detail_notes': list(frames['detail_notes']),
+        'deep_dives': deep_dives(frames, 3),
+        'files': list(REPORT_FILES)
+    }
+
+def generate_kaluza_ltr_report(data, frames=None):
+    """
+    Generate Kaluza LTR report based on the LTR_Template_Kaluza.txt format
+
+    Args:
+        data (Mapping): 'epics', 'maintenance' and 'utilization' DataFrames
+        frames (dict): Shared frames from compute_report_frames; computed
+            from data when not given
+    """
+    frames = frames or compute_report_frames(data)
+    exec_ltr_view = frames['exec_ltr_view']
+
+    # Line Items (UDEs)
+    line_items = [
+        {
+            'description': 'Epic Completion Rate',
+            'definition': 'Percentage of epics completed on time',
+            'owner': 'Project Manager',
+            'goal': 95,
+            'current_value': exec_ltr_view['completion_rate']
+        },
+        {
+            'description': 'Machine Utilization',
+            'definition': 'Percentage of time machines are actively running tasks',
+            'owner': 'Operations Manager',
+            'goal': 80,
+            'current_value': exec_ltr_view['avg_utilization']
+        },
+        {
+            'description': 'Maintenance Impact',
+            'definition': 'Total hours spent on maintenance activities',
+            'owner': 'Maintenance Lead',
+            'goal': 20,
+            'current_value': exec_ltr_view['maintenance_impact']
+        }
+    ]
+
+    return {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'line_items': line_items,
+        'key_updates': key_updates(frames, 3),
+        'exec_ltr_view': dict(exec_ltr_view),
+        'roadmap_updates': roadmap_updates(frames, 3),
+        'detail_notes': list(frames['detail_notes']),
+        'deep_dives': deep_dives(frames, 5),
+        'files': list(REPORT_FILES)
+    }
+
+def generate_all_reports(data, report_types=None):
+    """
+    Generate the Standard, RPA LTR and Kaluza LTR reports from one set of shared frames
+
+    Args:
+        data (Mapping): 'epics', 'maintenance' and 'utilization' DataFrames
+        report_types (list): Optional subset of REPORT_BUILDERS keys
+
+    Returns:
+        dict: Report type mapped to its report
+    """
+    frames = compute_report_frames(data)
+    return {
+        report_type: REPORT_BUILDERS[report_type](data, frames)
+        for report_type in (report_types or REPORT_BUILDERS)
+    }
+
+def generate_report_html(report):
+    """
+    Convert the report dictionary to HTML format
+    """
+    return render_report("Standard Report", report)
+
+def generate_rpa_ltr_html(report):
+    """Generate HTML for RPA LTR report"""
+    return render_report("RPA LTR Report", report)
+
+def generate_kaluza_ltr_html(report):
+    """Generate HTML for Kaluza LTR report"""
+    return render_report("Kaluza LTR Report", report)
+
+def report_excel_sheets(report_type, report):
+    """
+    Lay out a report as Excel sheets
+
+    Args:
+        report_type (str): Key of REPORT_BUILDERS
+        report (dict): Report built by that builder
+
+    Returns:
+        dict: Sheet name mapped to its DataFrame
+    """
+    if report_type == "Standard Report":
+        return {
+            'Data_Sources': pd.DataFrame(report['data_sources']),
+            'Metrics': pd.DataFrame([report['metrics']]),
+            'Insights': pd.DataFrame({'Insights': report['insights']}),
+            'Recommendations': pd.DataFrame({'Recommendations': report['recommendations']})
+        }
+
+    sheets = {}
+    if 'line_items' in report:
+        sheets['Line_Items'] = pd.DataFrame(report['line_items'])
+    sheets.update({
+        'Key_Updates': pd.DataFrame(report['key_updates']),
+        'Exec_LTR_View': pd.DataFrame([report['exec_ltr_view']]),
+        'Roadmap_Updates': pd.DataFrame(report['roadmap_updates']),
+        'Detail_Notes': pd.DataFrame({'Notes': report['detail_notes']}),
+        'Deep_Dives': pd.DataFrame(report['deep_dives']),
+        'Files': pd.DataFrame({'Files': report['files']})
+    })
+    return sheets
+
+REPORT_BUILDERS = {
+    "Standard Report": generate_comprehensive_report,
+    "RPA LTR Report": generate_rpa_ltr_report,
+    "Kaluza LTR Report": generate_kaluza_ltr_report
+}
+
+REPORT_HTML_RENDERERS = {
+    "Standard Report": generate_report_html,
+    "RPA LTR Report": generate_rpa_ltr_html,
+    "Kaluza LTR Report": generate_kaluza_ltr_html
+}
+
+# Base file name of each report type's downloads and saved files
+REPORT_FILE_STEMS = {
+    "Standard Report": "ltr_standard_report",
+    "RPA LTR Report": "ltr_rpa_report",
+    "Kaluza LTR Report": "ltr_kaluza_report"
+}
@@ -0,0 +1,118 @@
+import os
+from functools import lru_cache
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(MODULE_DIR, "templates")
+
+# Compiled templates are kept on disk so new processes (dashboard reruns, batch
+# workers) skip parsing and compiling them again. The default does not depend
+# on the working directory; point LTR_TEMPLATE_CACHE elsewhere to share it.
+TEMPLATE_CACHE_DIR = os.environ.get(
+    "LTR_TEMPLATE_CACHE", os.path.join(MODULE_DIR, "processed_data", ".cache", "templates")
+)
+
+# Rendered pieces joined into each chunk when streaming a template
+STREAM_BUFFER_SIZE = 64
+
+# Report templates by report type
+REPORT_TEMPLATES = {
+    "Standard Report": "reports/standard_report.html.j2",
+    "RPA LTR Report": "reports/rpa_ltr_report.html.j2",
+    "Kaluza LTR Report": "reports/kaluza_ltr_report.html.j2"
+}
+
+@lru_cache(maxsize=None)
+def get_environment(template_dir=TEMPLATE_DIR, cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    Create the template environment, once per process
+
+    Templates are compiled on first use and kept in memory; they are not
+    checked for changes afterwards, so restart the process after editing one.
+
+    Args:
+        template_dir (str): Directory the templates and partials are loaded from
+        cache_dir (str): Directory of the compiled template bytecode
+
+    Returns:
+        jinja2.Environment: Shared environment
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        autoescape=select_autoescape(enabled_extensions=('html', 'html.j2')),
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        cache_size=-1
+    )
+
+def get_template(name):
+    """
+    Get a compiled template
+
+    Args:
+        name (str): Template path relative to the templates directory
+
+    Returns:
+        jinja2.Template: Compiled template
+    """
+    return get_environment().get_template(name)
+
+def render_template(name, **context):
+    """
+    Render a template
+
+    Args:
+        name (str): Template path relative to the templates directory
+        **context: Template variables
+
+    Returns:
+        str: Rendered text
+    """
+    return get_template(name).render(**context)
+
+def render_report(report_type, report):
+    """
+    Render a report as HTML
+
+    Args:
+        report_type (str): Key of REPORT_TEMPLATES
+        report (dict): Report built for that type
+
+    Returns:
+        str: HTML document
+    """
+    return render_template(REPORT_TEMPLATES[report_type], report=report)
+
+def stream_report(report_type, report):
+    """
+    Render a report as HTML chunk by chunk
+
+    Sections are rendered as the stream is consumed, so the whole document is
+    never held in memory; iterate it to feed an HTTP response.
+
+    Args:
+        report_type (str): Key of REPORT_TEMPLATES
+        report (dict): Report built for that type
+
+    Returns:
+        jinja2.environment.TemplateStream: Iterable of HTML chunks
+    """
+    stream = get_template(REPORT_TEMPLATES[report_type]).stream(report=report)
+    stream.enable_buffering(STREAM_BUFFER_SIZE)
+    return stream
+
+def write_report(report_type, report, target, encoding=None):
+    """
+    Stream a report as HTML to a file
+
+    Args:
+        report_type (str): Key of REPORT_TEMPLATES
+        report (dict): Report built for that type
+        target: Path or file object to write to
+        encoding (str): Encode the chunks, for paths opened in binary mode or
+            binary file objects; None writes text
+    """
+    stream_report(report_type, report).dump(target, encoding=encoding)
@@ -0,0 +1,59 @@
+import pandas as pd
+import batch_reports
+from batch_reports import init_worker, run_job, slice_data
+from report_engine import generate_all_reports
+
+WEEK = 202516
+
+def report_data():
+    """Small report data set with one owner"""
+    epics = pd.DataFrame({
+        'Key': ['EP-1', 'EP-2'],
+        'summary': ["Invoice bot", "Claims bot"],
+        'Status': ["Done", "In Progress"],
+        'priority': ["High", "Medium"],
+        'Assignee': ["Edu Cielo", "Edu Cielo"],
+        'created': pd.to_datetime(['2025-01-06', '2025-02-03']),
+        'duedate': pd.to_datetime(['2025-03-01', '2025-05-01']),
+        'Start Date': pd.to_datetime(['2025-01-10', '2025-02-10']),
+        'Completed Date': pd.to_datetime(['2025-02-20', None]),
+        'Estimated Financial Impact': [12000.0, 8000.0],
+        'YearWeek': [202502, 202506]
+    })
+    maintenance = pd.DataFrame({
+        'SumMaintenance_Hours': [6.0],
+        'Total_Maintenance_Tickets_By_Week': [3],
+        'Maintenance_Time_Allocation_Percentage': [15.0],
+        'Assignee': ["Edu Cielo"],
+        'YearWeek': [WEEK]
+    })
+    utilization = pd.DataFrame({
+        'Machine_Utilization__': [72.5, 64.0],
+        'SumRuntime_duration__mins_': [1800.0, 1500.0],
+        'desktop_taskstatus': ["Succeeded", "Failed"],
+        'YearWeek': [WEEK, WEEK]
+    })
+    return {'epics': epics, 'maintenance': maintenance, 'utilization': utilization}
+
+def test_owner_without_rows_reports_missing_dates():
+    data = slice_data(report_data(), WEEK, "Nobody")
+    assert data['epics'].empty and data['maintenance'].empty
+
+    report = generate_all_reports(data, ['Standard Report'])['Standard Report']
+    assert report['data_sources']['jira_epics']['date_range'] == {'start': None, 'end': None}
+
+def test_run_job_writes_reports_for_owner_without_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_reports, '_shared_data', None)
+    init_worker(report_data())
+
+    week, owner, written = run_job(WEEK, "Nobody", ['Standard Report'], str(tmp_path))
+    assert (week, owner) == (WEEK, "Nobody")
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(written)
+
+    html = (tmp_path / next(name for name in written if name.endswith('.html'))).read_text()
+    assert "Date Range: N/A to N/A" in html
+
+def test_owner_with_rows_reports_date_range():
+    data = slice_data(report_data(), WEEK, "Edu Cielo")
+    report = generate_all_reports(data, ['Standard Report'])['Standard Report']
+    assert report['data_sources']['jira_epics']['date_range'] == {'start': '2025-01-06', 'end': '2025-02-03'}
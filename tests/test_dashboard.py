@@ -0,0 +1,36 @@
+import os
+from datetime import date
+import pytest
+from streamlit.testing.v1 import AppTest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sidebar date ranges inside the data bounds without rows for the pages
+EMPTY_WINDOWS = {
+    'weekend without rows': (date(2025, 2, 1), date(2025, 2, 2)),
+    'week without maintenance': (date(2025, 4, 14), date(2025, 4, 19))
+}
+
+def run_page(page, date_range, monkeypatch):
+    """Run the app on one page with a sidebar date range"""
+    monkeypatch.chdir(APP_DIR)
+    app = AppTest.from_file(os.path.join(APP_DIR, "app.py"), default_timeout=120)
+    app.session_state['selected_page'] = page
+    app.session_state['date_range'] = date_range
+    return app.run()
+
+@pytest.mark.parametrize("page", ["Summary Overview", "JIRA Epics Analysis", "Maintenance Analysis",
+                                  "Machine Utilization"])
+def test_page_without_rows_in_range(page, monkeypatch):
+    app = run_page(page, EMPTY_WINDOWS['weekend without rows'], monkeypatch)
+    assert not app.exception
+    assert not app.error
+    assert app.session_state['date_range'] == EMPTY_WINDOWS['weekend without rows']
+    assert not app.get('plotly_chart')
+    assert "No data in the selected range" in [info.value for info in app.info]
+
+def test_maintenance_page_without_maintenance_rows(monkeypatch):
+    app = run_page("Maintenance Analysis", EMPTY_WINDOWS['week without maintenance'], monkeypatch)
+    assert not app.exception
+    assert not app.error
+    assert [info.value for info in app.info].count("No data in the selected range") == 2
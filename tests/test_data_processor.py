@@ -0,0 +1,48 @@
+import pandas as pd
+from data_processor import convert_date_columns, create_week_column
+
+EXPORT_FIELDS = ['WeekOfYear', 'YearWeekIndex', 'Year - Week', 'Year - Wk']
+
+def export_rows(dates):
+    """Rows shaped like the Combine All export, with placeholder week fields"""
+    return pd.DataFrame({
+        'DateTimeStarted': pd.to_datetime(dates),
+        'WeekOfYear': 0,
+        'YearWeekIndex': 0,
+        'Year - Week': "",
+        'Year - Wk': ""
+    })
+
+def test_export_week_fields_start_on_sunday():
+    df = create_week_column(export_rows(['2025-04-12', '2025-04-13', '2025-04-14', '2025-04-19']),
+                            'DateTimeStarted', export_fields=EXPORT_FIELDS)
+    
+    # Sunday 2025-04-13 opens export week 16 but still is in ISO week 15
+    assert df['WeekOfYear'].tolist() == [15, 16, 16, 16]
+    assert df['YearWeekIndex'].tolist() == [202515, 202516, 202516, 202516]
+    assert df['Year - Week'].astype(str).tolist() == ["2025-15", "2025-16", "2025-16", "2025-16"]
+    assert df['Year - Wk'].astype(str).tolist() == ["2025-15", "2025-16", "2025-16", "2025-16"]
+    assert df['YearWeek'].tolist() == [202515, 202515, 202516, 202516]
+
+def test_export_week_fields_count_from_january_first():
+    df = create_week_column(export_rows(['2024-12-29', '2025-01-01', '2025-01-04', '2025-01-05']),
+                            'DateTimeStarted', export_fields=['WeekOfYear', 'YearWeekIndex'])
+    
+    assert df['YearWeekIndex'].tolist() == [202453, 202501, 202501, 202502]
+    assert df['YearWeek'].tolist() == [202452, 202501, 202501, 202501]
+
+def test_export_week_fields_keep_missing_values():
+    df = export_rows(['2025-04-13', '2025-04-14'])
+    df['Year - Wk'] = [None, "2025-16"]
+    df = create_week_column(df, 'DateTimeStarted', export_fields=EXPORT_FIELDS)
+    
+    assert df['Year - Wk'].isna().tolist() == [True, False]
+    assert df['Year - Week'].astype(str).tolist() == ["2025-16", "2025-16"]
+
+def test_excel_epoch_sentinels_become_missing():
+    # Runs that never completed carry the epoch day shifted to Central time
+    df = pd.DataFrame({'DateTimeCompleted_Central': ['2025-04-14T18:00:00', '1899-12-30T06:00:00']})
+    df = convert_date_columns(df, ['DateTimeCompleted_Central'], source='sentinel_test')
+    
+    assert df['DateTimeCompleted_Central'].tolist()[0] == pd.Timestamp('2025-04-14 18:00:00')
+    assert df['DateTimeCompleted_Central'].isna().tolist() == [False, True]
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from cubes import rollup_utilization
+
+# Most points a time series trace is drawn with, about one per pixel of a
+# full-width chart
+POINT_BUDGET = 1500
+
+# Traces with more points than this are drawn with WebGL
+WEBGL_THRESHOLD = 1000
+
+# Time resolutions of the utilization cube, finest first, with the
+# approximate length of one bucket in hours
+TIME_RESOLUTIONS = {
+    'Hour': 1,
+    'Day': 24,
+    'Week': 24 * 7,
+    'Month': 24 * 30
+}
+
+# Resolutions picked automatically; hourly detail is only shown on request
+AUTO_RESOLUTIONS = ['Day', 'Week', 'Month']
+
+def time_buckets(cube, resolution):
+    """
+    Get the start of the time bucket of each cube row
+
+    Args:
+        cube (pandas.DataFrame): Utilization cube with Day and Hour keys
+        resolution (str): Key of TIME_RESOLUTIONS
+
+    Returns:
+        pandas.Series: Bucket start timestamps
+    """
+    day = pd.to_datetime(cube['Day'])
+    if resolution == 'Hour':
+        return day + pd.to_timedelta(cube['Hour'].astype('float64'), unit='h')
+    if resolution == 'Week':
+        return day.dt.to_period('W-SUN').dt.start_time
+    if resolution == 'Month':
+        return day.dt.to_period('M').dt.start_time
+    return day
+
+def choose_resolution(start, end, budget=POINT_BUDGET):
+    """
+    Pick the finest automatic resolution that fits a time span in the budget
+
+    Args:
+        start: First timestamp of the span
+        end: Last timestamp of the span
+        budget (int): Most points to draw
+
+    Returns:
+        str: Key of TIME_RESOLUTIONS
+    """
+    span_hours = (pd.Timestamp(end) - pd.Timestamp(start)).total_seconds() / 3600 + 24
+    for resolution in AUTO_RESOLUTIONS:
+        if span_hours / TIME_RESOLUTIONS[resolution] <= budget:
+            return resolution
+    return AUTO_RESOLUTIONS[-1]
+
+def utilization_over_time(cube, resolution='Auto'):
+    """
+    Roll the utilization cube up to a time series
+
+    The cube holds sums and counts, so every resolution is re-aggregated
+    exactly rather than resampled from another one.
+
+    Args:
+        cube (pandas.DataFrame): Utilization cube, optionally pre-filtered
+        resolution (str): Key of TIME_RESOLUTIONS, or 'Auto' to fit the
+            cube's time span in POINT_BUDGET
+
+    Returns:
+        tuple: (rolled-up utilization metrics with a 'Time' column, resolution used)
+    """
+    if resolution == 'Auto':
+        resolution = choose_resolution(cube['Day'].min(), cube['Day'].max())
+    bucketed = cube.assign(Time=time_buckets(cube, resolution))
+    return rollup_utilization(bucketed, by=['Time']), resolution
+
+def lttb_indices(x, y, threshold):
+    """
+    Select the points that best keep the shape of a series
+
+    Largest-Triangle-Three-Buckets: the first and last points are kept and
+    each bucket in between contributes the point forming the largest
+    triangle with the previously selected point and the next bucket's mean.
+
+    Args:
+        x (array-like): Sorted x values, numeric or datetime
+        y (array-like): y values; missing values count as 0 when selecting
+        threshold (int): Number of points to keep
+
+    Returns:
+        numpy.ndarray: Positions of the selected points
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = pd.Series(x)
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x = x.astype('int64')
+    x = np.asarray(x, dtype='float64')
+    y = np.nan_to_num(np.asarray(y, dtype='float64'))
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        mean_x, mean_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs((x[selected] - mean_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (mean_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+def line_trace(x, y, budget=POINT_BUDGET, **kwargs):
+    """
+    Build a line trace, downsampled to the budget and drawn with WebGL when large
+
+    Args:
+        x (pandas.Series): Sorted x values
+        y (pandas.Series): y values
+        budget (int): Most points to draw
+        **kwargs: Trace properties, e.g. name and line
+
+    Returns:
+        plotly.graph_objects.Scatter or Scattergl: The trace
+    """
+    keep = lttb_indices(x, y, budget)
+    x, y = x.iloc[keep], y.iloc[keep]
+    trace_type = go.Scattergl if len(keep) > WEBGL_THRESHOLD else go.Scatter
+    return trace_type(x=x, y=y, **kwargs)
+
+def count_trace(x, y, budget=POINT_BUDGET, **kwargs):
+    """
+    Build a count trace: bars, or a WebGL filled line when there are too many bars to draw
+
+    Args:
+        x (pandas.Series): Sorted x values
+        y (pandas.Series): Counts
+        budget (int): Most points to draw
+        **kwargs: Trace properties; marker_color colors either form
+
+    Returns:
+        plotly.graph_objects.Bar or Scattergl: The trace
+    """
+    if len(x) <= WEBGL_THRESHOLD:
+        return go.Bar(x=x, y=y, **kwargs)
+    keep = lttb_indices(x, y, budget)
+    color = kwargs.pop('marker_color', None)
+    return go.Scattergl(x=x.iloc[keep], y=y.iloc[keep], mode='lines', fill='tozeroy',
+                        line=dict(color=color, width=1), **kwargs)